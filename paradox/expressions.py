@@ -106,6 +106,43 @@ def _wrapmult(pair: Tuple[str, Union[PyPrecedence, TSPrecedence, PHPPrecedence]]
 # TODO: each subclass of PanExpr() should recursively pull in imports from
 # inner expressions as per test_nested_python_imports()
 class PanExpr(abc.ABC):
+    # class tag tested by Statements.also() - a plain attribute probe there is cheaper
+    # than an isinstance() check against this ABC
+    _IS_PAN_EXPR = True
+
+    # lazily-cached copies of the get*Expr() strings, for the many call sites that
+    # don't care about the precedence. The mutating helpers (PanList.panAppend() and
+    # friends) clear these.
+    _cachedpy: Optional[str] = None
+    _cachedts: Optional[str] = None
+    _cachedphp: Optional[str] = None
+
+    def getPyExprStr(self) -> str:
+        """Like getPyExpr()[0], but the string is cached on the instance."""
+        cached = self._cachedpy
+        if cached is None:
+            self._cachedpy = cached = self.getPyExpr()[0]
+        return cached
+
+    def getTSExprStr(self) -> str:
+        """Like getTSExpr()[0], but the string is cached on the instance."""
+        cached = self._cachedts
+        if cached is None:
+            self._cachedts = cached = self.getTSExpr()[0]
+        return cached
+
+    def getPHPExprStr(self) -> str:
+        """Like getPHPExpr()[0], but the string is cached on the instance."""
+        cached = self._cachedphp
+        if cached is None:
+            self._cachedphp = cached = self.getPHPExpr()[0]
+        return cached
+
+    def _clearExprStrCache(self) -> None:
+        self._cachedpy = None
+        self._cachedts = None
+        self._cachedphp = None
+
     def cast(self, newtype: FlexiType) -> "PanCast":
         return PanCast(unflex(newtype), self)
 
@@ -264,7 +301,7 @@ class PanIsType(PanExpr):
             "list": "list",
             "dict": "dict",
         }
-        expr = self._expr.getPyExpr()[0]
+        expr = self._expr.getPyExprStr()
         return f"isinstance({expr}, {types_[self._expected]})", PyPrecedence.Dot
 
     def getTSExpr(self) -> Tuple[str, TSPrecedence]:
@@ -279,7 +316,7 @@ class PanIsType(PanExpr):
             "dict": "is_array",
         }
 
-        code = functions[self._expected] + "(" + self._expr.getPHPExpr()[0] + ")"
+        code = functions[self._expected] + "(" + self._expr.getPHPExprStr() + ")"
         return code, PHPPrecedence.Arrow
 
 
@@ -308,19 +345,20 @@ class PanList(PanExpr):
         return CrossList(self._innertype)
 
     def getPyExpr(self) -> Tuple[str, PyPrecedence]:
-        items = [v.getPyExpr()[0] for v in self._values]
+        items = [v.getPyExprStr() for v in self._values]
         return "[" + ", ".join(items) + "]", PyPrecedence.Literal
 
     def getTSExpr(self) -> Tuple[str, TSPrecedence]:
-        items = [v.getTSExpr()[0] for v in self._values]
+        items = [v.getTSExprStr() for v in self._values]
         return "[" + ", ".join(items) + "]", TSPrecedence.Literal
 
     def getPHPExpr(self) -> Tuple[str, PHPPrecedence]:
-        items = [v.getPHPExpr()[0] for v in self._values]
+        items = [v.getPHPExprStr() for v in self._values]
         return "[" + ", ".join(items) + "]", PHPPrecedence.Literal
 
     def panAppend(self, extra: PanExpr) -> None:
         self._values.append(extra)
+        self._clearExprStrCache()
 
 
 class PanDict(PanExpr):
@@ -341,17 +379,17 @@ class PanDict(PanExpr):
         return CrossDict(CrossStr(), self._valuetype)
 
     def getPyExpr(self) -> Tuple[str, PyPrecedence]:
-        inner = [f"{k!r}: {v.getPyExpr()[0]}" for k, v in self._pairs.items()]
+        inner = [f"{k!r}: {v.getPyExprStr()}" for k, v in self._pairs.items()]
         code = "{" + ", ".join(inner) + "}"
         return code, PyPrecedence.Literal
 
     def getTSExpr(self) -> Tuple[str, TSPrecedence]:
-        inner = [f"{k!r}: {v.getTSExpr()[0]}" for k, v in self._pairs.items()]
+        inner = [f"{k!r}: {v.getTSExprStr()}" for k, v in self._pairs.items()]
         code = "{" + ", ".join(inner) + "}"
         return code, TSPrecedence.Literal
 
     def getPHPExpr(self) -> Tuple[str, PHPPrecedence]:
-        inner = [_phpstr(k) + " => " + v.getPHPExpr()[0] for k, v in self._pairs.items()]
+        inner = [_phpstr(k) + " => " + v.getPHPExprStr() for k, v in self._pairs.items()]
         code = "[" + ", ".join(inner) + "]"
         return code, PHPPrecedence.Literal
 
@@ -361,6 +399,7 @@ class PanDict(PanExpr):
         realkey = key.getRawStr()
         assert realkey not in self._pairs
         self._pairs[realkey] = val
+        self._clearExprStrCache()
 
 
 # TODO: this needs to import typing.cast()
@@ -376,7 +415,7 @@ class PanCast(PanExpr):
 
     def getPyExpr(self) -> Tuple[str, PyPrecedence]:
         typeexpr = self._type.getQuotedPyType()
-        valexpr = self._expr.getPyExpr()[0]
+        valexpr = self._expr.getPyExprStr()
         return f"cast({typeexpr}, {valexpr})", PyPrecedence.MultDiv
 
     def getTSExpr(self) -> Tuple[str, TSPrecedence]:
@@ -402,7 +441,7 @@ class _PanItemAccess(PanExpr):
             targetstr = "(" + targetstr + ")"
 
         if isinstance(self._idx, PanExpr):
-            indexexpr = self._idx.getPyExpr()[0]
+            indexexpr = self._idx.getPyExprStr()
         else:
             indexexpr = repr(self._idx)
 
@@ -425,7 +464,7 @@ class _PanItemAccess(PanExpr):
             targetstr = "(" + targetstr + ")"
 
         if isinstance(self._idx, PanExpr):
-            indexexpr = self._idx.getTSExpr()[0]
+            indexexpr = self._idx.getTSExprStr()
         else:
             indexexpr = repr(self._idx)
 
@@ -448,7 +487,7 @@ class _PanItemAccess(PanExpr):
             targetstr = "(" + targetstr + ")"
 
         if isinstance(self._idx, PanExpr):
-            indexexpr = self._idx.getPHPExpr()[0]
+            indexexpr = self._idx.getPHPExprStr()
         elif isinstance(self._idx, int):
             indexexpr = repr(self._idx)
         else:
@@ -518,7 +557,7 @@ class PanKeyAccess(_PanItemAccess):
         fallbackexpr: PanExpr,
     ) -> Tuple[str, PyPrecedence]:
         return (
-            f"{targetstr}.get({indexstr}, {fallbackexpr.getPyExpr()[0]})",
+            f"{targetstr}.get({indexstr}, {fallbackexpr.getPyExprStr()})",
             PyPrecedence.Dot,
         )
 
@@ -530,7 +569,7 @@ class PanKeyAccess(_PanItemAccess):
     ) -> Tuple[str, TSPrecedence]:
         accessstr = targetstr + "[" + indexstr + "]"
         return (
-            f"{accessstr} === undefined ? {fallbackexpr.getTSExpr()[0]} : {accessstr}",
+            f"{accessstr} === undefined ? {fallbackexpr.getTSExprStr()} : {accessstr}",
             TSPrecedence.Dot,
         )
 
@@ -638,20 +677,22 @@ class PanCall(PanExpr):
 
     def addPositionalArg(self, expr: PanExpr) -> None:
         self._pargs.append(expr)
+        self._clearExprStrCache()
 
     def addKWArg(self, argname: str, expr: PanExpr) -> None:
         assert argname not in self._kwargs, f"Duplicate kwarg {argname!r}"
         assert expr is not None
         self._kwargs[argname] = expr
+        self._clearExprStrCache()
 
     def getPanType(self) -> CrossType:
         # TODO: implement this?
         raise NotImplementedError()
 
     def getPyExpr(self) -> Tuple[str, PyPrecedence]:
-        args = [a.getPyExpr()[0] for a in self._pargs]
+        args = [a.getPyExprStr() for a in self._pargs]
         for k, v in self._kwargs.items():
-            args.append(f"{k}={v.getPyExpr()[0]}")
+            args.append(f"{k}={v.getPyExprStr()}")
         argstr = ", ".join(args)
 
         if isinstance(self._target, str):
@@ -663,7 +704,7 @@ class PanCall(PanExpr):
         return target + "(" + argstr + ")", PyPrecedence.Dot
 
     def getTSExpr(self) -> Tuple[str, TSPrecedence]:
-        argstr = ", ".join(a.getTSExpr()[0] for a in self._pargs)
+        argstr = ", ".join(a.getTSExprStr() for a in self._pargs)
         assert not len(self._kwargs), "KWArgs not supported in TS"
 
         if isinstance(self._target, str):
@@ -679,7 +720,7 @@ class PanCall(PanExpr):
         return target + "(" + argstr + ")", TSPrecedence.Dot
 
     def getPHPExpr(self) -> Tuple[str, PHPPrecedence]:
-        argstr = ", ".join(a.getPHPExpr()[0] for a in self._pargs)
+        argstr = ", ".join(a.getPHPExprStr() for a in self._pargs)
         assert not len(self._kwargs), "KWArgs not supported in PHP"
 
         if isinstance(self._target, str):
@@ -707,28 +748,30 @@ class PanStringBuilder(PanExpr):
         return CrossStr()
 
     def getPyExpr(self) -> Tuple[str, PyPrecedence]:
-        expr = 'f"'
+        # build up a flat list of string segments in a single pass and join them at the
+        # end - much cheaper than growing a string with repeated "+="
+        segments = ['f"']
         for p in self._parts:
             if isinstance(p, PanLiteral) and p.isstr():
-                expr += repr(p.getRawStr())[1:-1].replace("{", "{{").replace("}", "}}")
+                segments.append(repr(p.getRawStr())[1:-1].replace("{", "{{").replace("}", "}}"))
             else:
-                expr += "{"
-                expr += p.getPyExpr()[0]
-                expr += "}"
-        expr += '"'
-        return expr, PyPrecedence.Literal
+                segments.append("{")
+                segments.append(p.getPyExprStr())
+                segments.append("}")
+        segments.append('"')
+        return "".join(segments), PyPrecedence.Literal
 
     def getTSExpr(self) -> Tuple[str, TSPrecedence]:
-        expr = "`"
+        segments = ["`"]
         for p in self._parts:
             if isinstance(p, PanLiteral) and p.isstr():
-                expr += repr(p.getRawStr())[1:-1].replace("$", "\\$")
+                segments.append(repr(p.getRawStr())[1:-1].replace("$", "\\$"))
             else:
-                expr += "${"
-                expr += p.getTSExpr()[0]
-                expr += "}"
-        expr += "`"
-        return expr, TSPrecedence.Literal
+                segments.append("${")
+                segments.append(p.getTSExprStr())
+                segments.append("}")
+        segments.append("`")
+        return "".join(segments), TSPrecedence.Literal
 
     def getPHPExpr(self) -> Tuple[str, PHPPrecedence]:
         parts = []
@@ -809,17 +852,17 @@ class PanAndOr(PanExpr):
 
     def getPyExpr(self) -> Tuple[str, PyPrecedence]:
         if len(self._arguments) == 1:
-            return f"bool({self._arguments[0].getPyExpr()[0]})", PyPrecedence.Literal
+            return f"bool({self._arguments[0].getPyExprStr()})", PyPrecedence.Literal
         # NOTE: we wrap each expr in parenthesis to avoid potential precedence issues
-        each = [f"({a.getPyExpr()[0]})" for a in self._arguments]
+        each = [f"({a.getPyExprStr()})" for a in self._arguments]
         join = " or " if self._operation == "OR" else " and "
         return f"bool({join.join(each)})", PyPrecedence.Literal
 
     def getTSExpr(self) -> Tuple[str, TSPrecedence]:
         if len(self._arguments) == 1:
-            return f"!!({self._arguments[0].getTSExpr()[0]})", TSPrecedence.AddSub
+            return f"!!({self._arguments[0].getTSExprStr()})", TSPrecedence.AddSub
         # NOTE: we wrap each expr in parenthesis to avoid potential precedence issues
-        each = [f"({a.getPyExpr()[0]})" for a in self._arguments]
+        each = [f"({a.getPyExprStr()})" for a in self._arguments]
         join = " || " if self._operation == "OR" else " && "
         return f"!!({join.join(each)})", TSPrecedence.Literal
 
@@ -885,13 +928,13 @@ class PanLengthExpr(PanExpr):
         return CrossNum()
 
     def getPyExpr(self) -> Tuple[str, PyPrecedence]:
-        return f"len({self._target.getPyExpr()[0]})", PyPrecedence.Literal
+        return f"len({self._target.getPyExprStr()})", PyPrecedence.Literal
 
     def getTSExpr(self) -> Tuple[str, TSPrecedence]:
         return _wrapdot(self._target.getTSExpr()) + ".length", TSPrecedence.Dot
 
     def getPHPExpr(self) -> Tuple[str, PHPPrecedence]:
-        inner = self._target.getPHPExpr()[0]
+        inner = self._target.getPHPExprStr()
         return f"count({inner})", PHPPrecedence.Literal
 
 
@@ -1091,7 +1134,7 @@ def tsexpr(code: str, prec: TSPrecedence = TSPrecedence.MultDiv) -> PanTSOnly:
 
 def pannotomit(expr: Pannable) -> PanExpr:
     return HardCodedExpr(
-        getpy=lambda: f"not isinstance({pan(expr).getPyExpr()[0]}, type(...))",
+        getpy=lambda: f"not isinstance({pan(expr).getPyExprStr()}, type(...))",
         getts=lambda: f"typeof {_wrapdot(pan(expr).getPyExpr())} !== 'undefined'",
     )
 
@@ -1,17 +1,19 @@
 import abc
 import builtins
-import itertools
-from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import (
+    Any,
+    Callable,
+    ContextManager,
     Dict,
+    Generic,
     Iterable,
-    Iterator,
     List,
     Literal,
     Optional,
     Set,
     Tuple,
+    TypeVar,
     Union,
     cast,
 )
@@ -28,6 +30,7 @@ from paradox.expressions import (
     PHPPrecedence,
     PyPrecedence,
     TSPrecedence,
+    _phpstr,
     pan,
     pannotomit,
     pyexpr,
@@ -64,6 +67,11 @@ class NoDefault:
 NO_DEFAULT = NoDefault()
 
 
+# sentinel used by FunctionSpec.addOverload() to detect args with no modification,
+# avoiding per-arg KeyError machinery
+_UNMODIFIED = object()
+
+
 def _pan_nodef(val: Union[Pannable, NoDefault]) -> Optional[PanExpr]:
     if val is NO_DEFAULT:
         return None
@@ -88,28 +96,64 @@ class Statement(WantsImports, abc.ABC):
         ...
 
 
+TBlock = TypeVar("TBlock", bound=Statement)
+
+
+class _BlockContext(Generic[TBlock]):
+    """Lightweight context manager returned by the with*() block helpers.
+
+    Much cheaper than @contextmanager, which drives a dedicated generator through two
+    next() calls for every block opened."""
+
+    __slots__ = ("_block",)
+
+    def __init__(self, block: TBlock) -> None:
+        self._block = block
+
+    def __enter__(self) -> TBlock:
+        return self._block
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+# shared immutable sentinel for _StatementWithCustomImports' import lists: most
+# statements never receive any custom imports, so we don't allocate three empty lists
+# per statement. alsoImport*() swap in a real list before appending.
+_NO_IMPORTS: Tuple[Any, ...] = ()
+
+
 class _StatementWithCustomImports(Statement):
-    _importspy: List[ImportSpecPy]
-    _importsts: List[ImportSpecTS]
-    _importsphp: List[ImportSpecPHP]
+    # these start out as the shared empty tuple and are upgraded to real lists by the
+    # alsoImport*() helpers
+    _importspy: Union[Tuple[ImportSpecPy, ...], List[ImportSpecPy]]
+    _importsts: Union[Tuple[ImportSpecTS, ...], List[ImportSpecTS]]
+    _importsphp: Union[Tuple[ImportSpecPHP, ...], List[ImportSpecPHP]]
 
     def __init__(self) -> None:
         super().__init__()
 
-        self._importspy = []
-        self._importsts = []
-        self._importsphp = []
+        self._importspy = _NO_IMPORTS
+        self._importsts = _NO_IMPORTS
+        self._importsphp = _NO_IMPORTS
 
     # TODO: add an alsoImportPHP()
     def alsoImportPy(self, module: str, names: List[str] = None) -> None:
+        imports = self._importspy
+        if not isinstance(imports, list):
+            # first custom import for this statement - upgrade from the shared tuple
+            self._importspy = imports = []
         if names is None:
-            self._importspy.append((module, None))
+            imports.append((module, None))
         else:
             for name in names:
-                self._importspy.append((module, name))
+                imports.append((module, name))
 
     def alsoImportTS(self, module: str, names: List[str] = None) -> None:
-        self._importsts.append((module, names))
+        imports = self._importsts
+        if not isinstance(imports, list):
+            self._importsts = imports = []
+        imports.append((module, names))
 
     def getImportsPy(self) -> Iterable[ImportSpecPy]:
         yield from super().getImportsPy()
@@ -132,30 +176,68 @@ class Statements(_StatementWithCustomImports, AcceptsStatements):
         self._statements = []
 
     def getImportsPy(self) -> Iterable[ImportSpecPy]:
-        yield from super().getImportsPy()
+        # child statements tend to repeat the same imports over and over ("typing" etc),
+        # so drop duplicates here rather than passing them all the way up the tree.
+        # First-seen order is preserved. A flat list is returned (not a generator) so
+        # that nested Statements don't stack suspended generator frames per tree level.
+        collected: List[ImportSpecPy] = []
+        seen: Set[ImportSpecPy] = set()
+        for spec in self._importspy:
+            if spec not in seen:
+                seen.add(spec)
+                collected.append(spec)
         for stmt in self._statements:
-            yield from stmt.getImportsPy()
+            for spec in stmt.getImportsPy():
+                if spec not in seen:
+                    seen.add(spec)
+                    collected.append(spec)
+        return collected
 
     def getImportsTS(self) -> Iterable[ImportSpecTS]:
-        yield from super().getImportsTS()
+        # NOTE: an ImportSpecTS isn't hashable (it may contain a list of names) so we
+        # build a hashable key for the dedupe set
+        collected: List[ImportSpecTS] = []
+        seen: Set[Tuple[str, Optional[Tuple[str, ...]]]] = set()
+        for spec in self._importsts:
+            key = (spec[0], None if spec[1] is None else tuple(spec[1]))
+            if key not in seen:
+                seen.add(key)
+                collected.append(spec)
         for stmt in self._statements:
-            yield from stmt.getImportsTS()
+            for spec in stmt.getImportsTS():
+                key = (spec[0], None if spec[1] is None else tuple(spec[1]))
+                if key not in seen:
+                    seen.add(key)
+                    collected.append(spec)
+        return collected
 
     def getImportsPHP(self) -> Iterable[ImportSpecPHP]:
-        yield from super().getImportsPHP()
+        collected: List[ImportSpecPHP] = []
+        seen: Set[ImportSpecPHP] = set()
+        for spec in self._importsphp:
+            if spec not in seen:
+                seen.add(spec)
+                collected.append(spec)
         for stmt in self._statements:
-            yield from stmt.getImportsPHP()
+            for spec in stmt.getImportsPHP():
+                if spec not in seen:
+                    seen.add(spec)
+                    collected.append(spec)
+        return collected
 
     def blank(self) -> None:
-        self._statements.append(BlankLine())
+        # BlankLine is stateless so all Statements can share the one instance
+        self._statements.append(_BLANK_LINE)
 
     def also(self, stmt_or_expr: AlsoParam) -> AlsoParam:
-        if isinstance(stmt_or_expr, PanExpr):
-            stmt: Statement = PanExprStatement(stmt_or_expr)
+        # XXX: this is a hot path during construction so we avoid runtime cast() calls
+        # and test PanExpr's class tag instead of isinstance() against the ABC
+        if getattr(stmt_or_expr, "_IS_PAN_EXPR", False):
+            stmt: Statement = PanExprStatement(stmt_or_expr)  # type: ignore
         else:
-            stmt = cast(Statement, stmt_or_expr)
+            stmt = stmt_or_expr  # type: ignore
         self._statements.append(stmt)
-        return cast(AlsoParam, stmt)
+        return stmt  # type: ignore
 
     def remark(self, text: str) -> None:
         self._statements.append(Comment(text))
@@ -227,75 +309,113 @@ class Statements(_StatementWithCustomImports, AcceptsStatements):
         )
         return realtarget
 
-    @contextmanager
-    def withTryBlock(self) -> "Iterator[TryCatchBlock]":
+    def withTryBlock(self) -> "ContextManager[TryCatchBlock]":
         block = TryCatchBlock()
         self._statements.append(block)
-        yield block
+        return _BlockContext(block)
 
-    @contextmanager
-    def withRawTS(self) -> "Iterator[RawTypescript]":
+    def withRawTS(self) -> "ContextManager[RawTypescript]":
         rawts = RawTypescript()
         self._statements.append(rawts)
-        yield rawts
+        return _BlockContext(rawts)
 
-    @contextmanager
-    def withCond(self, expr: PanExpr) -> "Iterator[ConditionalBlock]":
+    def withCond(self, expr: PanExpr) -> "ContextManager[ConditionalBlock]":
         cond = ConditionalBlock(expr, [])
         self._statements.append(cond)
-        yield cond
+        return _BlockContext(cond)
 
-    @contextmanager
     def withFor(
         self,
         assign: PanVar,
         expr: Pannable,
-    ) -> "Iterator[ForLoopBlock]":
+    ) -> "ContextManager[ForLoopBlock]":
         loop = ForLoopBlock(assign, pan(expr))
         self._statements.append(loop)
-        yield loop
+        return _BlockContext(loop)
 
-    @contextmanager
     def withDictIter(
         self,
         v_dict: PanExpr,
         v_val: PanVar,
         v_key: PanVar = None,
-    ) -> "Iterator[DictLoopBlock]":
+    ) -> "ContextManager[DictLoopBlock]":
         loop = DictLoopBlock(v_dict, v_val, v_key)
         self._statements.append(loop)
-        yield loop
+        return _BlockContext(loop)
+
+    def write_all(
+        self,
+        py_w: Optional[FileWriter],
+        ts_w: Optional[FileWriter],
+        php_w: Optional[FileWriter],
+    ) -> None:
+        """Render this statement tree in up to three languages in parallel.
+
+        Each writer receives exactly what a direct writepy()/writets()/writephp() call
+        would produce; pass None to skip a language. The writers are disjoint and
+        rendering only touches per-language caches (idempotent writes), so the
+        languages can safely run on separate threads."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        jobs: List[Tuple[Callable[[FileWriter], object], FileWriter]] = []
+        if py_w is not None:
+            jobs.append((self.writepy, py_w))
+        if ts_w is not None:
+            jobs.append((self.writets, ts_w))
+        if php_w is not None:
+            jobs.append((self.writephp, php_w))
+
+        if not jobs:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+            futures = [pool.submit(write, w) for write, w in jobs]
+
+        for future in futures:
+            # propagate any rendering exception
+            future.result()
 
     def writepy(self, w: FileWriter) -> int:
+        # NOTE: fast exit for the empty containers that crop up during tree building.
+        # Subclasses that emit their own headers (blocks, specs) override this method,
+        # so they are unaffected.
+        if not self._statements:
+            return 0
         written = 0
         for stmt in self._statements:
             written += stmt.writepy(w)
         return written
 
     def writets(self, w: FileWriter) -> None:
+        if not self._statements:
+            return
         for stmt in self._statements:
             stmt.writets(w)
 
     def writephp(self, w: FileWriter) -> None:
+        if not self._statements:
+            return
         for stmt in self._statements:
             stmt.writephp(w)
 
 
 class StatementWithNoImports(Statement):
+    # these return an empty tuple rather than building a fresh empty list - import
+    # collection visits every one of these nodes on every pass
     def getImportsPy(self) -> Iterable[ImportSpecPy]:
-        return []
+        return ()
 
     def getImportsTS(self) -> Iterable[ImportSpecTS]:
-        return []
+        return ()
 
     def getImportsPHP(self) -> Iterable[ImportSpecPHP]:
-        return []
+        return ()
 
 
 class Comment(StatementWithNoImports):
+    # NOTE: no super().__init__() call - none of the parent classes add any state, and
+    # skipping the chain saves a python-level call per statement constructed
     def __init__(self, text: str) -> None:
-        super().__init__()
-
         self._text = text
 
     def writepy(self, w: FileWriter) -> int:
@@ -321,21 +441,28 @@ class BlankLine(StatementWithNoImports):
         w.blank()
 
 
+_BLANK_LINE = BlankLine()
+
+
 class PanExprStatement(StatementWithNoImports):
+    # NOTE: no super().__init__() call - none of the parent classes add any state
     def __init__(self, expr: PanExpr) -> None:
-        super().__init__()
-
         self._expr = expr
 
     def writets(self, w: FileWriter) -> None:
-        w.line0(self._expr.getTSExpr()[0] + ";")
+        w.line0(self._expr.getTSExprStr() + ";")
 
     def writepy(self, w: FileWriter) -> int:
-        w.line0(self._expr.getPyExpr()[0])
+        w.line0(self._expr.getPyExprStr())
         return 1
 
     def writephp(self, w: FileWriter) -> None:
-        w.line0(self._expr.getPHPExpr()[0] + ";")
+        w.line0(self._expr.getPHPExprStr() + ";")
+
+
+# shared "..." body used by every FunctionSpec overload; the statement is immutable so
+# one instance serves them all
+_ELLIPSIS_STMT = PanExprStatement(pyexpr("..."))
 
 
 class HardCodedStatement(StatementWithNoImports):
@@ -352,40 +479,60 @@ class HardCodedStatement(StatementWithNoImports):
         self._typescript = typescript
         self._php = php
 
+        # swap in the right write*() implementation for each language now, so that writing the
+        # statement out doesn't need to re-test the ellipsis/None sentinels every time. The
+        # class-level write*() remain as the "no implementation given" error paths.
+        if python is None:
+            self.writepy = self._writepy_noop  # type: ignore
+        elif python is not ...:
+            self.writepy = self._writepy_line  # type: ignore
+        if typescript is None:
+            self.writets = self._writets_noop  # type: ignore
+        elif typescript is not ...:
+            self.writets = self._writets_line  # type: ignore
+        if php is None:
+            self.writephp = self._writephp_noop  # type: ignore
+        elif php is not ...:
+            self.writephp = self._writephp_line  # type: ignore
+
     def writets(self, w: FileWriter) -> None:
-        if self._typescript is ...:
-            raise ImplementationMissing(
-                "HardCodedStatement was not given a TypeScript implementation"
-            )
-        if self._typescript is not None:
-            # XXX: mypy doesn't realise that self._typescript cannot be ...
-            w.line0(self._typescript)  # type: ignore
+        raise ImplementationMissing(
+            "HardCodedStatement was not given a TypeScript implementation"
+        )
 
     def writepy(self, w: FileWriter) -> int:
-        if self._python is ...:
-            raise ImplementationMissing("HardCodedStatement was not given a Python implementation")
+        raise ImplementationMissing("HardCodedStatement was not given a Python implementation")
 
-        if self._python is None:
-            return 0
+    def writephp(self, w: FileWriter) -> None:
+        raise ImplementationMissing("HardCodedStatement was not given a PHP implementation")
+
+    def _writepy_noop(self, w: FileWriter) -> int:
+        return 0
 
-        # XXX: mypy doesn't realise that self._python cannot be ...
+    def _writepy_line(self, w: FileWriter) -> int:
+        # XXX: mypy doesn't realise that self._python must be a str here
         w.line0(self._python)  # type: ignore
         return 1
 
-    def writephp(self, w: FileWriter) -> None:
-        if self._php is ...:
-            raise ImplementationMissing("HardCodedStatement was not given a PHP implementation")
-        if self._php is not None:
-            # XXX: mypy doesn't realise that self._php cannot be ...
-            w.line0(self._php)  # type: ignore
+    def _writets_noop(self, w: FileWriter) -> None:
+        pass
+
+    def _writets_line(self, w: FileWriter) -> None:
+        # XXX: mypy doesn't realise that self._typescript must be a str here
+        w.line0(self._typescript)  # type: ignore
+
+    def _writephp_noop(self, w: FileWriter) -> None:
+        pass
+
+    def _writephp_line(self, w: FileWriter) -> None:
+        # XXX: mypy doesn't realise that self._php must be a str here
+        w.line0(self._php)  # type: ignore
 
 
 class RawTypescript(StatementWithNoImports):
     # TODO: deprecate this in favour of HardCodedStatement
 
     def __init__(self) -> None:
-        super().__init__()
-
         self._lines: List[str] = []
 
     def rawline(self, stmt: str) -> None:
@@ -409,45 +556,41 @@ class SimpleRaise(StatementWithNoImports):
     _ctor: Optional[str]
 
     def __init__(self, ctor: str = None, *, msg: str = None, expr: PanExpr = None) -> None:
-        super().__init__()
-
         assert msg is not None or expr is not None
 
         self._ctor = ctor
         self._msg = msg
         self._expr = expr
+        # resolve the per-language constructor fallbacks (and quote the message while
+        # we're at it) so write*() don't redo this every time
+        self._ctorpy: str = ctor if ctor is not None else "Exception"
+        self._ctorts: str = ctor or "Error"
+        self._ctorphp: str = ctor or "\\Exception"
+        self._msgrepr: Optional[str] = None if msg is None else repr(msg)
 
     def writepy(self, w: FileWriter) -> int:
-        ctor = "Exception"
-        if self._ctor is not None:
-            ctor = self._ctor
-        if self._msg is None:
+        if self._msgrepr is None:
             assert self._expr is not None
-            line = f"raise {ctor}({self._expr.getPyExpr()[0]})"
+            line = f"raise {self._ctorpy}({self._expr.getPyExprStr()})"
         else:
-            line = f"raise {ctor}({self._msg!r})"
+            line = f"raise {self._ctorpy}({self._msgrepr})"
         w.line0(line)
         return 1
 
     def writets(self, w: FileWriter) -> None:
-        ctor = self._ctor or "Error"
-        if self._msg is None:
+        if self._msgrepr is None:
             assert self._expr is not None
-            line = f"throw new {ctor}({self._expr.getPyExpr()[0]});"
+            line = f"throw new {self._ctorts}({self._expr.getPyExprStr()});"
         else:
-            line = f"throw new {ctor}({self._msg!r});"
+            line = f"throw new {self._ctorts}({self._msgrepr});"
         w.line0(line)
 
     def writephp(self, w: FileWriter) -> None:
-        ctor = self._ctor or "\\Exception"
         if self._msg is None:
             assert self._expr is not None
-            line = f"throw new {ctor}({self._expr.getPHPExpr()[0]});"
+            line = f"throw new {self._ctorphp}({self._expr.getPHPExprStr()});"
         else:
-            # TODO: don't import this here
-            from paradox.expressions import _phpstr
-
-            line = f"throw new {ctor}({_phpstr(self._msg)});"
+            line = f"throw new {self._ctorphp}({_phpstr(self._msg)});"
         w.line0(line)
 
 
@@ -465,28 +608,27 @@ class ConditionalBlock(Statements):
         self._alternates = []
         self._else = None
 
-    @contextmanager
-    def withElseif(self, expr: PanExpr) -> "Iterator[Statements]":
+    def withElseif(self, expr: PanExpr) -> "ContextManager[Statements]":
         stmts = Statements()
         self._alternates.append((expr, stmts))
-        yield stmts
+        return _BlockContext(stmts)
 
-    @contextmanager
-    def withElse(self) -> "Iterator[Statements]":
+    def withElse(self) -> "ContextManager[Statements]":
         assert not self._else
         stmts = Statements()
         self._else = stmts
-        yield stmts
+        return _BlockContext(stmts)
 
     def writepy(self, w: FileWriter) -> int:
-        w.line0(f"if {self._expr.getPyExpr()[0]}:")
+        w.line0(f"if {self._expr.getPyExprStr()}:")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writepy(w.with_more_indent())
+            stmt.writepy(w_inner)
 
         # TODO: if none of self._statements wrote a line of code, we should inject a 'pass'
         for altexpr, altstmt in self._alternates:
-            w.line0(f"elif {altexpr.getPyExpr()[0]}:")
-            if not altstmt.writepy(w.with_more_indent()):
+            w.line0(f"elif {altexpr.getPyExprStr()}:")
+            if not altstmt.writepy(w_inner):
                 w.line1("pass")
 
         if self._else:
@@ -500,13 +642,14 @@ class ConditionalBlock(Statements):
         return 1
 
     def writets(self, w: FileWriter) -> None:
-        w.line0(f"if ({self._expr.getTSExpr()[0]}) {{")
+        w.line0(f"if ({self._expr.getTSExprStr()}) {{")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writets(w.with_more_indent())
+            stmt.writets(w_inner)
 
         for altexpr, altstmt in self._alternates:
-            w.line0(f"}} else if ({altexpr.getTSExpr()[0]}) {{")
-            altstmt.writets(w.with_more_indent())
+            w.line0(f"}} else if ({altexpr.getTSExprStr()}) {{")
+            altstmt.writets(w_inner)
 
         if self._else:
             w.line0(f"}} else {{")
@@ -518,13 +661,14 @@ class ConditionalBlock(Statements):
         w.blank()
 
     def writephp(self, w: FileWriter) -> None:
-        w.line0(f"if ({self._expr.getPHPExpr()[0]}) {{")
+        w.line0(f"if ({self._expr.getPHPExprStr()}) {{")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writephp(w.with_more_indent())
+            stmt.writephp(w_inner)
 
         for altexpr, altstmt in self._alternates:
-            w.line0(f"}} elseif ({altexpr.getPHPExpr()[0]}) {{")
-            altstmt.writephp(w.with_more_indent())
+            w.line0(f"}} elseif ({altexpr.getPHPExprStr()}) {{")
+            altstmt.writephp(w_inner)
 
         if self._else:
             w.line0(f"}} else {{")
@@ -544,15 +688,17 @@ class CatchBlock(Statements):
         self.catchvar = catchvar
 
     def writepy(self, w: FileWriter) -> int:
-        intro = "except"
+        # build the intro in a list and join once rather than growing a str
+        parts = ["except"]
         if self.catchexpr:
-            intro += " " + self.catchexpr
+            parts.append(" " + self.catchexpr)
             if self.catchvar:
-                intro += " as " + self.catchvar
-        intro += ":"
-        w.line0(intro)
+                parts.append(" as " + self.catchvar)
+        parts.append(":")
+        w.line0("".join(parts))
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writepy(w.with_more_indent())
+            stmt.writepy(w_inner)
 
         # TODO: if none of self._statements wrote a line of code, we should inject a 'pass'
 
@@ -565,12 +711,10 @@ class CatchBlock(Statements):
         if not self.catchexpr:
             raise Exception("CatchBlock cannot be turned to PHP without a catchexpr")
 
-        intro = "} catch (" + self.catchexpr
-        intro += " $" + (self.catchvar or "_")
-        intro += ") {"
-        w.line0(intro)
+        w.line0(f"}} catch ({self.catchexpr} ${self.catchvar or '_'}) {{")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writephp(w.with_more_indent())
+            stmt.writephp(w_inner)
 
 
 # TODO: get rid of the old CatchBlock
@@ -595,17 +739,15 @@ class CatchBlock2(Statements):
     def writepy(self, w: FileWriter) -> int:
         # XXX: remember that for Python you almost certainly don't want a bare "except:" as that
         # would catch process signals and such.
-        if self._pyclass:
-            intro = "except " + self._pyclass
-        else:
-            intro = "except Exception"
+        parts = ["except " + self._pyclass if self._pyclass else "except Exception"]
         if self._var:
-            intro += " as " + self._var.getPyExpr()[0]
-        intro += ":"
-        w.line0(intro)
+            parts.append(" as " + self._var.getPyExprStr())
+        parts.append(":")
+        w.line0("".join(parts))
         body_count = 0
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            body_count += stmt.writepy(w.with_more_indent())
+            body_count += stmt.writepy(w_inner)
 
         # TODO: this logic needs to be copied across to other types of Statements
         if not body_count:
@@ -617,32 +759,39 @@ class CatchBlock2(Statements):
         raise Exception("TODO: CatchBlock2 is not directly written")  # noqa
 
     def writephp(self, w: FileWriter) -> None:
-        intro = "} catch (" + (self._phpclass or "Exception")
-        intro += " $" + (self._var.rawname if self._var else "_")
-        intro += ") {"
-        w.line0(intro)
+        phpclass = self._phpclass or "Exception"
+        phpvar = self._var.rawname if self._var else "_"
+        w.line0(f"}} catch ({phpclass} ${phpvar}) {{")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writephp(w.with_more_indent())
+            stmt.writephp(w_inner)
 
 
 class FinallyBlock(Statements):
     def writepy(self, w: FileWriter) -> int:
         w.line0("finally:")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writepy(w.with_more_indent())
+            stmt.writepy(w_inner)
 
         # TODO: inject 'pass' statement if there no statements wrote a body
         return 1
 
     def writets(self, w: FileWriter) -> None:
         w.line0("} finally {")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writets(w.with_more_indent())
+            stmt.writets(w_inner)
 
     def writephp(self, w: FileWriter) -> None:
         w.line0("} finally {")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writephp(w.with_more_indent())
+            stmt.writephp(w_inner)
+
+
+# (catchvar, catch blocks with a specific ts class, optional catch-all block)
+_TSCatchAnalysis = Tuple[Optional[str], List[CatchBlock2], Optional[CatchBlock2]]
 
 
 class TryCatchBlock(Statements):
@@ -652,59 +801,33 @@ class TryCatchBlock(Statements):
         super().__init__()
 
         self._catchblocks: List[Union[CatchBlock, CatchBlock2]] = []
+        # writets()'s catch-block analysis, computed lazily and reused across writes.
+        # Invalidated when another catch block is added.
+        self._ts_analysis: Optional[_TSCatchAnalysis] = None
 
-    @contextmanager
-    def withCatchBlock(self, catchexpr: str, catchvar: str = "") -> Iterator[CatchBlock]:
+    def withCatchBlock(self, catchexpr: str, catchvar: str = "") -> ContextManager[CatchBlock]:
         block = CatchBlock(catchexpr, catchvar)
         self._catchblocks.append(block)
-        yield block
+        self._ts_analysis = None
+        return _BlockContext(block)
 
-    @contextmanager
     def withCatchBlock2(
         self,
         var: PanVar = None,
         pyclass: str = None,
         tsclass: str = None,
         phpclass: str = None,
-    ) -> Iterator[CatchBlock2]:
+    ) -> ContextManager[CatchBlock2]:
         block = CatchBlock2(var, pyclass=pyclass, tsclass=tsclass, phpclass=phpclass)
         self._catchblocks.append(block)
-        yield block
+        self._ts_analysis = None
+        return _BlockContext(block)
 
-    @contextmanager
-    def withFinallyBlock(self) -> Iterator[FinallyBlock]:
-        if self._finallyblock:
-            raise InvalidLogic("Cannot have multiple FinallyBlocks under a single TryCatchBlock")
-
-        block = FinallyBlock()
-        self._finallyblock = block
-        yield block
-
-    def writepy(self, w: FileWriter) -> int:
-        w.line0("try:")
-        for stmt in self._statements:
-            stmt.writepy(w.with_more_indent())
-
-        # TODO: if none of self._statements wrote a line of code, we should inject a 'pass'
-
-        # catch blocks
-        for cb in self._catchblocks:
-            # write out catch blocks without increasing indent
-            cb.writepy(w)
-
-        if self._finallyblock:
-            # write out finally: block without increasing indent
-            self._finallyblock.writepy(w)
-
-        return 1
-
-    def writets(self, w: FileWriter) -> None:
-        w.line0(f"try {{")
-        for stmt in self._statements:
-            stmt.writets(w.with_more_indent())
-
-        assert len(self._catchblocks), "TryCatchBlock must have at least one Catch block"
+    def _analyzeCatchBlocksTS(self) -> "_TSCatchAnalysis":
+        """Partition catch blocks for TypeScript and sanity-check their varnames.
 
+        This stays lazy (not done in withCatchBlock2()) because the restrictions only
+        apply when the tree is actually rendered as TypeScript."""
         # all catch blocks must be a CatchBlock2 and have the same var name
         catchvar = None
         catchspecific: List[CatchBlock2] = []
@@ -736,23 +859,67 @@ class TryCatchBlock(Statements):
                 "at least one CatchBlock2 must have a varname for generating typescript"
             )
 
+        self._ts_analysis = (catchvar, catchspecific, catchall)
+        return self._ts_analysis
+
+    def withFinallyBlock(self) -> ContextManager[FinallyBlock]:
+        if self._finallyblock:
+            raise InvalidLogic("Cannot have multiple FinallyBlocks under a single TryCatchBlock")
+
+        block = FinallyBlock()
+        self._finallyblock = block
+        return _BlockContext(block)
+
+    def writepy(self, w: FileWriter) -> int:
+        w.line0("try:")
+        w_inner = w.with_more_indent()
+        for stmt in self._statements:
+            stmt.writepy(w_inner)
+
+        # TODO: if none of self._statements wrote a line of code, we should inject a 'pass'
+
+        # catch blocks
+        for cb in self._catchblocks:
+            # write out catch blocks without increasing indent
+            cb.writepy(w)
+
+        if self._finallyblock:
+            # write out finally: block without increasing indent
+            self._finallyblock.writepy(w)
+
+        return 1
+
+    def writets(self, w: FileWriter) -> None:
+        w.line0(f"try {{")
+        w_inner = w.with_more_indent()
+        for stmt in self._statements:
+            stmt.writets(w_inner)
+
+        assert self._catchblocks, "TryCatchBlock must have at least one Catch block"
+
+        analysis = self._ts_analysis
+        if analysis is None:
+            analysis = self._analyzeCatchBlocksTS()
+        catchvar, catchspecific, catchall = analysis
+
         w.line0(f"}} catch ({catchvar}) {{")
         if catchspecific:
             first = True
             for cb in catchspecific:
-                assert isinstance(cb, CatchBlock2)
                 if first:
                     construct = "if"
                     first = False
                 else:
                     construct = "} else if"
                 w.line1(f"{construct} ({catchvar} instanceof {cb._tsclass}) {{")
+                w_inner = w.with_more_indent()
                 for stmt in cb._statements:
-                    stmt.writets(w.with_more_indent().with_more_indent())
+                    stmt.writets(w_inner.with_more_indent())
             if catchall:
                 w.line1(f"}} else {{")
+                w_inner = w.with_more_indent()
                 for stmt in catchall._statements:
-                    stmt.writets(w.with_more_indent().with_more_indent())
+                    stmt.writets(w_inner.with_more_indent())
             # close off the last catch block
             w.line1(f"}}")
 
@@ -762,8 +929,9 @@ class TryCatchBlock(Statements):
                 w.line1(f"throw {catchvar};")
         else:
             assert catchall is not None
+            w_inner = w.with_more_indent()
             for stmt in catchall._statements:
-                stmt.writets(w.with_more_indent())
+                stmt.writets(w_inner)
 
         if self._finallyblock:
             # write out finally: block without increasing indent
@@ -773,8 +941,9 @@ class TryCatchBlock(Statements):
 
     def writephp(self, w: FileWriter) -> None:
         w.line0("try {")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writephp(w.with_more_indent())
+            stmt.writephp(w_inner)
 
         # catch blocks
         for cb in self._catchblocks:
@@ -804,14 +973,15 @@ class DictLoopBlock(Statements):
         self._statements: List[Statement] = statements or []
 
     def writepy(self, w: FileWriter) -> int:
-        v_val = self._v_val.getPyExpr()[0]
+        v_val = self._v_val.getPyExprStr()
         if self._v_key:
-            v_key = self._v_key.getPyExpr()[0]
-            w.line0(f"for {v_key}, {v_val} in ({self._expr.getPyExpr()[0]}).items():")
+            v_key = self._v_key.getPyExprStr()
+            w.line0(f"for {v_key}, {v_val} in ({self._expr.getPyExprStr()}).items():")
         else:
-            w.line0(f"for {v_val} in ({self._expr.getPyExpr()[0]}).values():")
+            w.line0(f"for {v_val} in ({self._expr.getPyExprStr()}).values():")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writepy(w.with_more_indent())
+            stmt.writepy(w_inner)
 
         # TODO: if none of self._statements wrote a line of code, we should inject a 'pass'
 
@@ -823,12 +993,13 @@ class DictLoopBlock(Statements):
         raise Exception("TODO: implement this for TS")  # noqa
 
     def writephp(self, w: FileWriter) -> None:
-        assignto = self._v_val.getPHPExpr()[0]
+        assignto = self._v_val.getPHPExprStr()
         if self._v_key:
-            assignto = self._v_key.getPHPExpr()[0] + " => " + assignto
-        w.line0(f"foreach ({self._expr.getPHPExpr()[0]} as {assignto}) {{")
+            assignto = self._v_key.getPHPExprStr() + " => " + assignto
+        w.line0(f"foreach ({self._expr.getPHPExprStr()} as {assignto}) {{")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writephp(w.with_more_indent())
+            stmt.writephp(w_inner)
         w.line0(f"}}")
         # always put a blank line after a for loop
         w.blank()
@@ -848,9 +1019,10 @@ class ForLoopBlock(Statements):
         self._statements: List[Statement] = statements or []
 
     def writepy(self, w: FileWriter) -> int:
-        w.line0(f"for {self._assign.getPyExpr()[0]} in {self._expr.getPyExpr()[0]}:")
+        w.line0(f"for {self._assign.getPyExprStr()} in {self._expr.getPyExprStr()}:")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writepy(w.with_more_indent())
+            stmt.writepy(w_inner)
 
         # TODO: if none of self._statements wrote a line of code, we should inject a 'pass'
 
@@ -859,17 +1031,19 @@ class ForLoopBlock(Statements):
         return 1
 
     def writets(self, w: FileWriter) -> None:
-        w.line0(f"for (let {self._assign.getTSExpr()[0]} of {self._expr.getTSExpr()[0]}) {{")
+        w.line0(f"for (let {self._assign.getTSExprStr()} of {self._expr.getTSExprStr()}) {{")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writets(w.with_more_indent())
+            stmt.writets(w_inner)
         w.line0(f"}}")
         # always put a blank line after a for loop
         w.blank()
 
     def writephp(self, w: FileWriter) -> None:
-        w.line0(f"foreach ({self._expr.getPHPExpr()[0]} as {self._assign.getPHPExpr()[0]}) {{")
+        w.line0(f"foreach ({self._expr.getPHPExprStr()} as {self._assign.getPHPExprStr()}) {{")
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            stmt.writephp(w.with_more_indent())
+            stmt.writephp(w_inner)
         w.line0(f"}}")
         # always put a blank line after a for loop
         w.blank()
@@ -879,55 +1053,60 @@ class ReturnStatement(StatementWithNoImports):
     _expr: PanExpr
 
     def __init__(self, expr: PanExpr) -> None:
-        super().__init__()
-
         self._expr = expr
+        # resolved once here so each write*() branches on a bool instead of repeating
+        # the isinstance() check
+        self._is_omit: bool = isinstance(expr, PanOmit)
 
     def writepy(self, w: FileWriter) -> int:
-        if isinstance(self._expr, PanOmit):
+        if self._is_omit:
             w.line0("return")
         else:
-            w.line0("return " + self._expr.getPyExpr()[0])
+            w.line0("return " + self._expr.getPyExprStr())
         return 1
 
     def writets(self, w: FileWriter) -> None:
-        if isinstance(self._expr, PanOmit):
+        if self._is_omit:
             w.line0("return;")
         else:
-            w.line0("return " + self._expr.getTSExpr()[0] + ";")
+            w.line0("return " + self._expr.getTSExprStr() + ";")
 
     def writephp(self, w: FileWriter) -> None:
-        if isinstance(self._expr, PanOmit):
+        if self._is_omit:
             w.line0("return;")
         else:
-            w.line0("return " + self._expr.getPHPExpr()[0] + ";")
+            w.line0("return " + self._expr.getPHPExprStr() + ";")
+
+
+# hoisted out of ListAppendStatement.write*() because enum attribute lookups aren't free
+_PY_MULTDIV = PyPrecedence.MultDiv.value
+_TS_MULTDIV = TSPrecedence.MultDiv.value
+_PHP_ARROW = PHPPrecedence.Arrow.value
 
 
 class ListAppendStatement(StatementWithNoImports):
     def __init__(self, list_: PanExpr, value: PanExpr) -> None:
-        super().__init__()
-
         self._list: PanExpr = list_
         self._value: PanExpr = value
 
     def writepy(self, w: FileWriter) -> int:
         list_, prec = self._list.getPyExpr()
-        if prec.value >= PyPrecedence.MultDiv.value:
+        if prec.value >= _PY_MULTDIV:
             list_ = "(" + list_ + ")"
-        w.line0(list_ + ".append(" + self._value.getPyExpr()[0] + ")")
+        w.line0(list_ + ".append(" + self._value.getPyExprStr() + ")")
         return 1
 
     def writets(self, w: FileWriter) -> None:
         list_, prec = self._list.getTSExpr()
-        if prec.value >= TSPrecedence.MultDiv.value:
+        if prec.value >= _TS_MULTDIV:
             list_ = "(" + list_ + ")"
-        w.line0(list_ + ".push(" + self._value.getTSExpr()[0] + ");")
+        w.line0(list_ + ".push(" + self._value.getTSExprStr() + ");")
 
     def writephp(self, w: FileWriter) -> None:
         list_, prec = self._list.getPHPExpr()
-        if prec.value > PHPPrecedence.Arrow.value:
+        if prec.value > _PHP_ARROW:
             list_ = "(" + list_ + ")"
-        w.line0(list_ + "[] = " + self._value.getPHPExpr()[0] + ";")
+        w.line0(list_ + "[] = " + self._value.getPHPExprStr() + ";")
 
 
 class AssignmentStatement(Statement):
@@ -947,8 +1126,10 @@ class AssignmentStatement(Statement):
         self._expr: Optional[PanExpr] = expr
         self._declare: bool = declare
         self._declaretype: bool = declaretype
+        # resolved once here because every write*() and getImportsPy() needs it
+        self._typedecl: bool = declare and declaretype
 
-        if declare and declaretype:
+        if self._typedecl:
             try:
                 # make sure the target has type information
                 self._target.getPanType()
@@ -966,42 +1147,41 @@ class AssignmentStatement(Statement):
 
     def getImportsPy(self) -> Iterable[ImportSpecPy]:
         yield from super().getImportsPy()
-        if self._declare and self._declaretype:
+        if self._typedecl:
             pantype: CrossType = self._target.getPanType()
-            yield from pantype.getPyImports()
+            yield from pantype.getPyImportsList()
 
     def writepy(self, w: FileWriter) -> int:
-        left = self._target.getPyExpr()[0]
-        if self._declare and self._declaretype:
+        left = self._target.getPyExprStr()
+        if self._typedecl:
             left += ": " + self._target.getPanType().getQuotedPyType()
         if self._expr is None:
             w.line0(left)
         else:
-            w.line0(f"{left} = {self._expr.getPyExpr()[0]}")
+            w.line0(f"{left} = {self._expr.getPyExprStr()}")
         return 1
 
     def writets(self, w: FileWriter) -> None:
-        left = self._target.getTSExpr()[0]
+        left = self._target.getTSExprStr()
         if self._declare:
             left = f"let {left}"
             if self._declaretype:
-                left += ": " + self._target.getPanType().getTSType()[0]
+                left += ": " + self._target.getPanType().getTSTypeStr()
 
         if self._expr is None:
             w.line0(f"{left};")
         else:
-            w.line0(f"{left} = {self._expr.getTSExpr()[0]};")
+            w.line0(f"{left} = {self._expr.getTSExprStr()};")
 
     def writephp(self, w: FileWriter) -> None:
-        if self._declare and self._declaretype:
-            phptypes = self._target.getPanType().getPHPTypes()
-            w.line0(f"/** @var {phptypes[1]} */")
+        if self._typedecl:
+            w.line0(f"/** @var {self._target.getPanType().getPHPDocType()} */")
 
-        left = self._target.getPHPExpr()[0]
+        left = self._target.getPHPExprStr()
 
         # you can't just make a variable declaration in PHP
         assert self._expr is not None
-        w.line0(f"{left} = {self._expr.getPHPExpr()[0]};")
+        w.line0(f"{left} = {self._expr.getPHPExprStr()};")
 
 
 class DictBuilderStatement(Statement):
@@ -1028,11 +1208,16 @@ class DictBuilderStatement(Statement):
             self._var = var
         self._type = realtype
 
-        self._keys: List[Tuple[str, bool]] = []
+        # keys are split into the omittable/non-omittable groups up front so the
+        # writers never have to filter (and writephp()'s unsupported-check is O(1))
+        self._nonomit_keys: List[str] = []
+        self._omit_keys: List[str] = []
+        # lazily-built omittable-key expressions, shared by writepy()/writets()
+        self._omitexprs: Dict[str, PanExpr] = {}
 
     def getImportsPy(self) -> Iterable[ImportSpecPy]:
         yield from super().getImportsPy()
-        yield from self._type.getValueType().getPyImports()
+        yield from self._type.getValueType().getPyImportsList()
         yield "typing", "Dict"
 
     def getImportsTS(self) -> Iterable[ImportSpecTS]:
@@ -1042,59 +1227,60 @@ class DictBuilderStatement(Statement):
         return []
 
     def addPair(self, key: str, allowomit: bool) -> None:
-        self._keys.append((key, allowomit))
+        if allowomit:
+            self._omit_keys.append(key)
+        else:
+            self._nonomit_keys.append(key)
+
+    def _getOmitExpr(self, key: str) -> PanExpr:
+        expr = self._omitexprs.get(key)
+        if expr is None:
+            expr = self._omitexprs[key] = pannotomit(PanVar(key, None))
+        return expr
 
     def writepy(self, w: FileWriter) -> int:
-        inner = ", ".join([f"{k!r}: {k}" for k, allowomit in self._keys if not allowomit])
+        inner = ", ".join([f"{k!r}: {k}" for k in self._nonomit_keys])
 
-        varstr = self._var.getPyExpr()[0]
+        varstr = self._var.getPyExprStr()
 
         w.line0(f"{varstr}: {self._type.getQuotedPyType()} = {{{inner}}}")
 
         # now do the omittable args
-        for k, allowomit in self._keys:
-            if allowomit:
-                # FIXME: this isn't how we want to do omitted args - we should be doing ellipsis
-                expr = pannotomit(PanVar(k, None))
-                w.line0(f"if {expr.getPyExpr()[0]}:")
-                w.line1(f"{varstr}[{k!r}] = {k}")
+        for k in self._omit_keys:
+            # FIXME: this isn't how we want to do omitted args - we should be doing ellipsis
+            expr = self._getOmitExpr(k)
+            w.line0(f"if {expr.getPyExprStr()}:")
+            w.line1(f"{varstr}[{k!r}] = {k}")
         return 1
 
     def writets(self, w: FileWriter) -> None:
-        inner = ", ".join([f"{k!r}: {k}" for k, allowomit in self._keys if not allowomit])
+        inner = ", ".join([f"{k!r}: {k}" for k in self._nonomit_keys])
 
-        varstr = self._var.getTSExpr()[0]
+        varstr = self._var.getTSExprStr()
 
-        w.line0(f"let {varstr}: {self._type.getTSType()[0]} = {{{inner}}};")
+        w.line0(f"let {varstr}: {self._type.getTSTypeStr()} = {{{inner}}};")
 
         # now do the omittable args
-        for k, allowomit in self._keys:
-            if allowomit:
-                expr = pannotomit(PanVar(k, None))
-                w.line0(f"if ({expr.getTSExpr()[0]}) {{")
-                w.line1(f"{varstr}[{k!r}] = {k};")
-                w.line0(f"}}")
+        for k in self._omit_keys:
+            expr = self._getOmitExpr(k)
+            w.line0(f"if ({expr.getTSExprStr()}) {{")
+            w.line1(f"{varstr}[{k!r}] = {k};")
+            w.line0(f"}}")
 
     def writephp(self, w: FileWriter) -> None:
-        # TODO: don't import this here
-        from paradox.expressions import _phpstr
-
-        phptype = self._type.getPHPTypes()[0]
+        phptype = self._type.getPHPArgType()
         if phptype:
             w.line0(f"/** @var {phptype} */")
 
-        inner = ", ".join(
-            [_phpstr(k) + " => $" + k for k, allowomit in self._keys if not allowomit]
-        )
+        inner = ", ".join([f"{_phpstr(k)} => ${k}" for k in self._nonomit_keys])
 
-        varstr = self._var.getPHPExpr()[0]
+        varstr = self._var.getPHPExprStr()
 
         w.line0(f"{varstr} = [{inner}];")
 
         # now do the omittable args
-        for k, allowomit in self._keys:
-            if allowomit:
-                raise NotSupportedError("omittable args aren't supported by PHP")
+        if self._omit_keys:
+            raise NotSupportedError("omittable args aren't supported by PHP")
 
 
 class FunctionSpec(Statements):
@@ -1160,27 +1346,24 @@ class FunctionSpec(Statements):
         overload._ismethod = self._ismethod
         overload._isasync = self._isasync
         overload._decorators_py.append("@typing.overload")
-        overload._statements.append(PanExprStatement(pyexpr("...")))
+        overload._statements.append(_ELLIPSIS_STMT)
 
-        arglist = [
+        get_modification = modifications.get
+        for source, dest in (
             (self._pargs, overload._pargs),
             (self._kwargs, overload._kwargs),
-        ]
-
-        for source, dest in arglist:
+        ):
             for name, crosstype, default in source:
-                try:
-                    modified: Optional[FlexiType] = modifications[name]
-                except KeyError:
+                modified = get_modification(name, _UNMODIFIED)
+                if modified is _UNMODIFIED:
                     # append the argument without modifications and without a default
                     dest.append((name, crosstype, None))
-                else:
-                    if modified is None:
-                        # the argument has been disabled in this overload
-                        continue
-
-                    # append the argument with the modified type and no default
-                    dest.append((name, unflex(modified), None))
+                elif modified is not None:
+                    # append the argument with the modified type and no default.
+                    # XXX: the cast() is needed because mypy can't narrow away the
+                    # sentinel from an identity check
+                    dest.append((name, unflex(cast(FlexiType, modified)), None))
+                # (modified is None - the argument has been disabled in this overload)
 
         self._overloads.append(overload)
 
@@ -1229,7 +1412,7 @@ class FunctionSpec(Statements):
         allowomit: bool,
         nullable: bool,
     ) -> PanVar:
-        assert not len(self._overloads), "Added an arg after an overload was defined"
+        assert not self._overloads, "Added an arg after an overload was defined"
 
         if nullable:
             crosstype = maybe(crosstype)
@@ -1263,26 +1446,34 @@ class FunctionSpec(Statements):
         if self._isabstract:
             w.line0("@abc.abstractmethod")
 
-        # header
+        # header - the arg lines are collected into a list (one f-string each, no
+        # repeated concatenation) and emitted with a single batched write
         w.line0(f"def {self._name}(")
 
+        arglines: List[str] = []
+
         if self._ismethod:
-            w.line1("class_," if self._isstaticmethod else "self,")
+            arglines.append("class_," if self._isstaticmethod else "self,")
 
         for argname, crosstype, argdefault in self._pargs:
-            argstr = argname + ": " + crosstype.getQuotedPyType()
-            if argdefault is not None:
-                argstr += " = " + argdefault.getPyExpr()[0]
-            w.line1(argstr + ",")
-        if len(self._kwargs):
+            if argdefault is None:
+                arglines.append(f"{argname}: {crosstype.getQuotedPyType()},")
+            else:
+                arglines.append(
+                    f"{argname}: {crosstype.getQuotedPyType()} = {argdefault.getPyExprStr()},"
+                )
+        if self._kwargs:
             # mark start of kwargs
-            w.line1("*,")
+            arglines.append("*,")
         for argname, argtype, argdefault in self._kwargs:
-            argstr = argname
-            argstr += ": " + argtype.getQuotedPyType()
-            if argdefault is not None:
-                argstr += " = " + argdefault.getPyExpr()[0]
-            w.line1(argstr + ",")
+            if argdefault is None:
+                arglines.append(f"{argname}: {argtype.getQuotedPyType()},")
+            else:
+                arglines.append(
+                    f"{argname}: {argtype.getQuotedPyType()} = {argdefault.getPyExprStr()},"
+                )
+
+        w.lines1(arglines)
 
         if self._rettype is None:
             w.line0(f") -> None:")
@@ -1292,14 +1483,12 @@ class FunctionSpec(Statements):
         havebody = 0
 
         if self._docstring:
-            w.line1('"""')
-            for docline in self._docstring:
-                w.line1(docline)
-            w.line1('"""')
+            w.lines1(['"""', *self._docstring, '"""'])
             havebody += 1
 
+        w_inner = w.with_more_indent()
         for stmt in self._statements:
-            havebody += stmt.writepy(w.with_more_indent())
+            havebody += stmt.writepy(w_inner)
             if self._isabstract:
                 raise InvalidLogic(
                     f"Abstract FunctionSpec {self._name}() must not have any statements"
@@ -1325,7 +1514,7 @@ class FunctionSpec(Statements):
             modifiers.append("async")
 
         if self._isabstract:
-            if len(self._statements):
+            if self._statements:
                 raise InvalidLogic(
                     f"Abstract FunctionSpec {self._name}() must not have any statements"
                 )
@@ -1343,23 +1532,23 @@ class FunctionSpec(Statements):
             w.line0(decoration)
 
         if self._ismethod:
-            if not len(modifiers):
+            if not modifiers:
                 modifiers.append("public")
         else:
             modifiers.append("function")
 
         name = "constructor" if self._isconstructor else self._name
-        w.line0((" ".join(modifiers)) + " " + name + "(")
+        w.line0(f"{' '.join(modifiers)} {name}(")
 
         if self._kwargs:
             raise NotSupportedError("TypeScript does not support kwargs")
 
         # header
         for argname, crosstype, argdefault in self._pargs:
-            argstr = argname + ": " + crosstype.getTSType()[0]
-            if argdefault is not None:
-                argstr += " = " + argdefault.getTSExpr()[0]
-            w.line1(argstr + ",")
+            if argdefault is None:
+                w.line1(f"{argname}: {crosstype.getTSTypeStr()},")
+            else:
+                w.line1(f"{argname}: {crosstype.getTSTypeStr()} = {argdefault.getTSExprStr()},")
 
         rettype: str = "void"
         if self._isconstructor:
@@ -1367,7 +1556,7 @@ class FunctionSpec(Statements):
             rettype = ""
         else:
             if self._rettype is not None:
-                rettype = self._rettype.getTSType()[0]
+                rettype = self._rettype.getTSTypeStr()
             if self._isasync:
                 rettype = "Promise<" + rettype + ">"
 
@@ -1375,8 +1564,9 @@ class FunctionSpec(Statements):
             w.line0(f"): {rettype};" if rettype else ");")
         else:
             w.line0(f"): {rettype} {{" if rettype else ") {")
+            w_inner = w.with_more_indent()
             for stmt in self._statements:
-                stmt.writets(w.with_more_indent())
+                stmt.writets(w_inner)
             w.line0("}")
 
     def writephp(self, w: FileWriter) -> None:
@@ -1391,7 +1581,7 @@ class FunctionSpec(Statements):
             w.line0(" */")
 
         if self._isabstract:
-            if len(self._statements):
+            if self._statements:
                 raise InvalidLogic(
                     f"Abstract FunctionSpec {self._name}() must not have any statements"
                 )
@@ -1408,32 +1598,37 @@ class FunctionSpec(Statements):
         if self._ismethod:
             modifiers.append("public")
 
-        prefix = modifiers + ["function"]
+        modifiers.append("function")
 
         name = "__construct" if self._isconstructor else self._name
-        w.line0((" ".join(prefix)) + " " + name + "(")
+        w.line0(f"{' '.join(modifiers)} {name}(")
 
-        if len(self._kwargs):
+        if self._kwargs:
             raise NotSupportedError("PHP does not support kwargs")
 
-        # header
-        argnum = 0
-        comma = ","
+        # header - collect the arg lines (one join each, no repeated concatenation),
+        # add the separating commas in one pass (PHP forbids a trailing comma), then
+        # emit the block with a single batched write
+        arglines: List[str] = []
         for argname, crosstype, argdefault in self._pargs:
-            argnum += 1
-            if argnum == len(self._pargs):
-                comma = ""
-            argstr = "$" + argname
-            phptype = crosstype.getPHPTypes()[0]
+            parts: List[str] = []
+            phptype = crosstype.getPHPArgType()
             if phptype:
-                argstr = phptype + " " + argstr
+                parts.append(phptype)
+                parts.append(" ")
+            parts.append("$")
+            parts.append(argname)
             if argdefault is not None:
-                argstr += " = " + argdefault.getPHPExpr()[0]
-            w.line1(argstr + comma)
+                parts.append(" = ")
+                parts.append(argdefault.getPHPExprStr())
+            arglines.append("".join(parts))
+        for i in range(len(arglines) - 1):
+            arglines[i] += ","
+        w.lines1(arglines)
 
         rettype: str = ""
         if not self._isconstructor and self._rettype is not None:
-            rettype = self._rettype.getPHPTypes()[0] or ""
+            rettype = self._rettype.getPHPArgType() or ""
 
         if rettype:
             rettype = ": " + rettype
@@ -1442,25 +1637,26 @@ class FunctionSpec(Statements):
             w.line0(f"){rettype};")
         else:
             w.line0(f"){rettype} {{")
+            w_inner = w.with_more_indent()
             for stmt in self._statements:
-                stmt.writephp(w.with_more_indent())
+                stmt.writephp(w_inner)
             w.line0("}")
 
     def getImportsPy(self) -> Iterable[ImportSpecPy]:
+        # NOTE: statement imports are covered by super() - Statements.getImportsPy()
+        # already walks self._statements (deduped), so don't walk them a second time
         yield from super().getImportsPy()
 
         if self._isabstract:
             yield "abc", None
-        for stmt in self._statements:
-            yield from stmt.getImportsPy()
 
-        crosstypes: List[CrossType] = [a[1] for a in itertools.chain(self._pargs, self._kwargs)]
+        for _, crosstype, _default in self._pargs:
+            yield from crosstype.getPyImportsList()
+        for _, crosstype, _default in self._kwargs:
+            yield from crosstype.getPyImportsList()
 
         if self._rettype is not None:
-            crosstypes.append(self._rettype)
-
-        for crosstype in crosstypes:
-            yield from crosstype.getPyImports()
+            yield from self._rettype.getPyImportsList()
 
         if self._overloads:
             yield "typing", None
@@ -1469,11 +1665,9 @@ class FunctionSpec(Statements):
             yield from overload.getImportsPy()
 
     def getImportsTS(self) -> Iterable[ImportSpecTS]:
+        # NOTE: as per getImportsPy(), statement imports are covered by super()
         yield from super().getImportsTS()
 
-        for stmt in self._statements:
-            yield from stmt.getImportsTS()
-
         for overload in self._overloads:
             yield from overload.getImportsTS()
 
@@ -1487,6 +1681,9 @@ class ClassProperty:
     propdefault: Optional[PanExpr]
     tsobservable: bool = False
     tsreadonly: bool = False
+    # computed once in ClassSpec.addProperty() so the ts/php property loops don't
+    # re-run isinstance() per property per emission
+    propdefault_is_literal: bool = False
 
 
 class ClassSpec(_StatementWithCustomImports):
@@ -1507,6 +1704,10 @@ class ClassSpec(_StatementWithCustomImports):
 
         self._name = name
         self._docstring = docstring
+        # stripped once here; writepy()/writephp() re-stripped every line per emission
+        self._docstring_stripped: Optional[List[str]] = (
+            [d.strip() for d in docstring] if docstring else None
+        )
         self._isabstract = isabstract
         self._pydataclass = pydataclass
         self._propnames: Set[str] = set()
@@ -1519,6 +1720,9 @@ class ClassSpec(_StatementWithCustomImports):
         self._decorators: List[str] = []
         self._tsexport: bool = tsexport
         self._pybases: List[str] = []
+        # per-language cache for _getInitSpec() - building the constructor spec is
+        # expensive and both getImports*() and write*() need it
+        self._initspec_cache: Dict[str, Optional[FunctionSpec]] = {}
 
     @property
     def classname(self) -> str:
@@ -1534,16 +1738,19 @@ class ClassSpec(_StatementWithCustomImports):
             raise InvalidLogic("Cannot use send_args_kwargs=False and send_args_kwargs=True")
 
         self._pybases.append(name)
+        self._initspec_cache.clear()
 
     def setPHPParentClass(self, name: str) -> None:
         if self._phpbase:
             raise InvalidLogic("Cannot add multiple PHP parent classes")
         self._phpbase = name
+        self._initspec_cache.clear()
 
     def setTypeScriptParentClass(self, name: str) -> None:
         if self._tsbase:
             raise InvalidLogic("Cannot add multiple TypeScript parent classes")
         self._tsbase = name
+        self._initspec_cache.clear()
 
     def createMethod(
         self,
@@ -1597,11 +1804,18 @@ class ClassSpec(_StatementWithCustomImports):
                 propdefault=realdefault,
                 tsobservable=tsobservable,
                 tsreadonly=tsreadonly,
+                propdefault_is_literal=isinstance(realdefault, PanLiteral),
             )
         )
+        self._initspec_cache.clear()
         return PanProp(name, crosstype, None)
 
     def _getInitSpec(self, lang: Literal["python", "typescript", "php"]) -> Optional[FunctionSpec]:
+        try:
+            return self._initspec_cache[lang]
+        except KeyError:
+            pass
+
         initdefaults = self._initdefaults
 
         if lang in ("typescript", "php"):
@@ -1611,6 +1825,7 @@ class ClassSpec(_StatementWithCustomImports):
 
         # do we actually need the __init__() method or was it a noop?
         if not (self._initargs or initdefaults):
+            self._initspec_cache[lang] = None
             return None
 
         initspec = FunctionSpec._getconstructor()
@@ -1648,47 +1863,53 @@ class ClassSpec(_StatementWithCustomImports):
         for name, default, crosstype in initdefaults:
             initspec.alsoAssign(PanProp(name, crosstype, None), default)
 
+        self._initspec_cache[lang] = initspec
         return initspec
 
     def getImportsPy(self) -> Iterable[ImportSpecPy]:
-        yield from super().getImportsPy()
+        # build a flat list rather than chaining generators - see
+        # Statements.getImportsPy() for rationale
+        out: List[ImportSpecPy] = list(self._importspy)
         if self._isabstract:
-            yield "abc", None
+            out.append(("abc", None))
         if self._pydataclass:
-            yield "dataclasses", "dataclass"
+            out.append(("dataclasses", "dataclass"))
         constructor = self._getInitSpec("python")
         if constructor:
-            yield from constructor.getImportsPy()
+            out.extend(constructor.getImportsPy())
         for prop in self._properties:
-            yield from prop.proptype.getPyImports()
+            out.extend(prop.proptype.getPyImportsList())
         for method in self._methods:
-            yield from method.getImportsPy()
+            out.extend(method.getImportsPy())
+        return out
 
     def getImportsTS(self) -> Iterable[ImportSpecTS]:
-        yield from self._importsts
+        out: List[ImportSpecTS] = list(self._importsts)
 
         for prop in self._properties:
             # TODO: also need to yield imports from properties
             if prop.tsobservable:
                 # TODO: unit test this code path
-                yield "mobx", ["observable"]
+                out.append(("mobx", ["observable"]))
                 break
         constructor = self._getInitSpec("typescript")
         if constructor:
-            yield from constructor.getImportsTS()
+            out.extend(constructor.getImportsTS())
         for method in self._methods:
-            yield from method.getImportsTS()
+            out.extend(method.getImportsTS())
+        return out
 
     def getImportsPHP(self) -> Iterable[ImportSpecPHP]:
-        yield from super().getImportsPHP()
+        out: List[ImportSpecPHP] = list(self._importsphp)
 
         # TODO: also need to yield imports from properties
 
         constructor = self._getInitSpec("php")
         if constructor:
-            yield from constructor.getImportsPHP()
+            out.extend(constructor.getImportsPHP())
         for method in self._methods:
-            yield from method.getImportsPHP()
+            out.extend(method.getImportsPHP())
+        return out
 
     def remark(self, comment: str) -> None:
         self._remarks.append(comment)
@@ -1707,31 +1928,31 @@ class ClassSpec(_StatementWithCustomImports):
         if parents:
             parents = "(" + parents + ")"
         w.line0(f"class {self._name}{parents}:")
-        if self._docstring:
-            w.line1('"""')
-            for docline in self._docstring:
-                w.line1(docline.strip())
-            w.line1('"""')
+        if self._docstring_stripped:
+            w.lines1(['"""', *self._docstring_stripped, '"""'])
             w.blank()
             havebody = True
 
-        # first write out properties
+        # first write out properties (w.line1 hoisted out of the loop)
+        line1 = w.line1
         for prop in self._properties:
-            w.line1(f"{prop.propname}: {prop.proptype.getQuotedPyType()}")
+            line1(f"{prop.propname}: {prop.proptype.getQuotedPyType()}")
         if self._properties:
             w.blank()
             havebody = True
 
+        w_inner = w.with_more_indent()
+
         # add an __init__() method to set default values
         initspec = self._getInitSpec("python")
         if initspec:
-            initspec.writepy(w.with_more_indent())
+            initspec.writepy(w_inner)
             w.blank()
             havebody = True
 
         # all other methods
         for method in self._methods:
-            method.writepy(w.with_more_indent())
+            method.writepy(w_inner)
             w.blank()
             havebody = True
 
@@ -1751,12 +1972,13 @@ class ClassSpec(_StatementWithCustomImports):
                 w.line0(" * " + docline)
             w.line0(" */")
 
-        prefix = ""
+        # assemble the header prefix with a single join rather than repeated "+="
+        prefix_parts: List[str] = []
         if self._tsexport:
-            prefix = "export "
-
+            prefix_parts.append("export ")
         if self._isabstract:
-            prefix += "abstract "
+            prefix_parts.append("abstract ")
+        prefix = "".join(prefix_parts)
 
         extends = ""
         if self._tsbase:
@@ -1778,25 +2000,28 @@ class ClassSpec(_StatementWithCustomImports):
             assign = ""
 
             # only assign values in the class body if the value is a literal
-            if prop.propdefault and isinstance(prop.propdefault, PanLiteral):
-                assign = " = " + prop.propdefault.getTSExpr()[0]
+            if prop.propdefault_is_literal:
+                assert prop.propdefault is not None
+                assign = " = " + prop.propdefault.getTSExprStr()
 
-            w.line1(f"{prefix}{prop.propname}: {prop.proptype.getTSType()[0]}{assign};")
+            w.line1(f"{prefix}{prop.propname}: {prop.proptype.getTSTypeStr()}{assign};")
             needemptyline = True
 
+        w_inner = w.with_more_indent()
+
         # add an __init__() method to set default values
         constructor = self._getInitSpec("typescript")
         if constructor:
             if needemptyline:
                 w.blank()
-            constructor.writets(w.with_more_indent())
+            constructor.writets(w_inner)
             needemptyline = True
 
         # all other methods
         for method in self._methods:
             if needemptyline:
                 w.blank()
-            method.writets(w.with_more_indent())
+            method.writets(w_inner)
             needemptyline = True
 
         for comment in self._remarks:
@@ -1806,16 +2031,10 @@ class ClassSpec(_StatementWithCustomImports):
         w.line0("}")
 
     def writephp(self, w: FileWriter) -> None:
-        prefix = ""
-
-        if self._isabstract:
-            prefix += "abstract "
+        prefix = "abstract " if self._isabstract else ""
 
-        if self._docstring:
-            w.line0("/**")
-            for docline in self._docstring:
-                w.line0(" * " + docline.strip())
-            w.line0(" */")
+        if self._docstring_stripped:
+            w.lines0(["/**", *(" * " + docline for docline in self._docstring_stripped), " */"])
 
         extends = ""
         if self._phpbase:
@@ -1830,27 +2049,29 @@ class ClassSpec(_StatementWithCustomImports):
             assign = ""
 
             # only assign values in the class body if the value is a literal
-            if prop.propdefault and isinstance(prop.propdefault, PanLiteral):
-                assign = " = " + prop.propdefault.getPHPExpr()[0]
+            if prop.propdefault_is_literal:
+                assert prop.propdefault is not None
+                assign = " = " + prop.propdefault.getPHPExprStr()
 
-            phptypes = prop.proptype.getPHPTypes()
-            w.line1(f"/** @var {phptypes[1]} */")
+            w.line1(f"/** @var {prop.proptype.getPHPDocType()} */")
             w.line1(f"public ${prop.propname}{assign};")
             needemptyline = True
 
+        w_inner = w.with_more_indent()
+
         # add an __init__() method to set default values
         constructor = self._getInitSpec("php")
         if constructor:
             if needemptyline:
                 w.blank()
-            constructor.writephp(w.with_more_indent())
+            constructor.writephp(w_inner)
             needemptyline = True
 
         # all other methods
         for method in self._methods:
             if needemptyline:
                 w.blank()
-            method.writephp(w.with_more_indent())
+            method.writephp(w_inner)
             needemptyline = True
 
         if needemptyline:
@@ -1884,7 +2105,7 @@ class InterfaceSpec(_StatementWithCustomImports):
     def getImportsPy(self) -> Iterable[ImportSpecPy]:
         yield from super().getImportsPy()
         for _, crosstype in self._properties:
-            yield from crosstype.getPyImports()
+            yield from crosstype.getPyImportsList()
 
     def getImportsPHP(self) -> Iterable[ImportSpecPHP]:
         yield from super().getImportsPHP()
@@ -1893,12 +2114,7 @@ class InterfaceSpec(_StatementWithCustomImports):
 
     def getImportsTS(self) -> Iterable[ImportSpecTS]:
         yield from super().getImportsTS()
-        # TODO: make sure this is unit tested
-        for name, crosstype in self._properties:
-            # TODO: get imports from crosstype
-            # yield from crosstype.getImportsTS()
-            pass
-        return []
+        # TODO: also yield imports from each property's crosstype
 
     def writepy(self, w: FileWriter) -> int:
         raise NotSupportedError("InterfaceSpec can't generate python code")
@@ -1906,8 +2122,8 @@ class InterfaceSpec(_StatementWithCustomImports):
     def writets(self, w: FileWriter) -> None:
         export = "export " if self._tsexport else ""
         w.line0(f"{export}interface {self._name} {{")
-        for propname, proptype in self._properties:
-            w.line1(f"{propname}: {proptype.getTSType()[0]};")
+        # the body has no conditional logic per property, so emit it as one block
+        w.lines1([f"{name}: {proptype.getTSTypeStr()};" for name, proptype in self._properties])
         w.line0(f"}}")
 
     def writephp(self, w: FileWriter) -> None:
@@ -1,9 +1,8 @@
 import abc
-from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
+    ContextManager,
     Iterable,
-    Iterator,
     List,
     Literal,
     Optional,
@@ -100,32 +99,28 @@ class AcceptsStatements(abc.ABC):
         ...
 
     @abc.abstractmethod
-    @contextmanager
-    def withTryBlock(self) -> "Iterator[TryCatchBlock]":
+    def withTryBlock(self) -> "ContextManager[TryCatchBlock]":
         ...
 
     @abc.abstractmethod
-    @contextmanager
-    def withCond(self, expr: "PanExpr") -> "Iterator[ConditionalBlock]":
+    def withCond(self, expr: "PanExpr") -> "ContextManager[ConditionalBlock]":
         ...
 
     @abc.abstractmethod
-    @contextmanager
     def withFor(
         self,
         assign: "PanVar",
         expr: "Pannable",
-    ) -> "Iterator[ForLoopBlock]":
+    ) -> "ContextManager[ForLoopBlock]":
         ...
 
     @abc.abstractmethod
-    @contextmanager
     def withDictIter(
         self,
         v_dict: "PanExpr",
         v_val: "PanVar",
         v_key: "PanVar" = None,
-    ) -> "Iterator[DictLoopBlock]":
+    ) -> "ContextManager[DictLoopBlock]":
         ...
 
 
@@ -1,8 +1,17 @@
 import io
-from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Dict, Iterator, List, Literal, Optional, Union
+from types import ModuleType
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    ContextManager,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 
 from paradox.interfaces import AcceptsStatements, AlsoParam, InvalidLogic
 
@@ -35,25 +44,69 @@ class FileWriter:
         self._f = f
         self._indentstr: str = indentstr
         self._baseindent: int = baseindent
-
-    def _wline(self, indent: int, line: str) -> None:
-        # when indent is -1, always write with no indent
-        indentstr = ""
-        if indent != -1:
-            indentstr = self._indentstr * (indent + self._baseindent)
-        self._f.write(indentstr + line + "\n")
+        # precompute the prefixes used by line0()/line1() so we don't rebuild them for every
+        # line written out
+        self._prefix0: str = indentstr * baseindent
+        self._prefix1: str = indentstr * (baseindent + 1)
+        self._child: Optional["FileWriter"] = None
 
     def line0(self, line: str) -> None:
-        self._wline(0, line)
+        self._f.write(self._prefix0 + line + "\n")
 
     def line1(self, line: str) -> None:
-        self._wline(1, line)
+        self._f.write(self._prefix1 + line + "\n")
+
+    def lines0(self, lines: List[str]) -> None:
+        """Write multiple lines at this writer's base indent with a single write() call."""
+        prefix = self._prefix0
+        self._f.write("".join([prefix + line + "\n" for line in lines]))
+
+    def lines1(self, lines: List[str]) -> None:
+        """Write multiple lines at one extra indent with a single write() call."""
+        prefix = self._prefix1
+        self._f.write("".join([prefix + line + "\n" for line in lines]))
 
     def blank(self) -> None:
         self._f.write("\n")
 
     def with_more_indent(self) -> "FileWriter":
-        return FileWriter(self._f, self._indentstr, self._baseindent + 1)
+        # indent only ever steps down by one, so each FileWriter needs at most one child;
+        # build it on first use and hand the same one back after that. (All FileWriter
+        # state is fixed at construction so sharing is safe.)
+        child = self._child
+        if child is None:
+            child = self._child = FileWriter(self._f, self._indentstr, self._baseindent + 1)
+        return child
+
+
+# per-language output helper modules, populated on first use by _get_output_module().
+# (They can't be imported at module top because they import FileWriter/Script back out
+# of this module.)
+_output_modules: "Dict[str, ModuleType]" = {}
+
+
+def _get_output_module(lang: str) -> "ModuleType":
+    cached = _output_modules.get(lang)
+    if cached is not None:
+        return cached
+
+    langmod: ModuleType
+    if lang == "php":
+        from paradox.output import php
+
+        langmod = php
+    elif lang == "python":
+        from paradox.output import python
+
+        langmod = python
+    else:
+        assert lang == "typescript"
+        from paradox.output import typescript
+
+        langmod = typescript
+
+    _output_modules[lang] = langmod
+    return langmod
 
 
 class Script(AcceptsStatements):
@@ -72,6 +125,18 @@ class Script(AcceptsStatements):
         """Supercedes the old FileSpec.filecomment()"""
         self._file_comments.append(text)
 
+    def is_empty(self) -> bool:
+        """True when rendering this Script would produce nothing but boilerplate."""
+        content = self._content
+        return not (
+            self._file_comments
+            or self._new_types
+            or content._statements
+            or content._importspy
+            or content._importsts
+            or content._importsphp
+        )
+
     def add_new_type(self, name: str, base: "CrossType", *, tsexport: bool = False) -> None:
         if name in self._new_types:
             raise InvalidLogic(f"Cannot add two new types named {name!r}")
@@ -113,34 +178,26 @@ class Script(AcceptsStatements):
     ) -> "PanVar":
         return self._content.alsoDeclare(target, type, value)
 
-    @contextmanager
-    def withTryBlock(self) -> "Iterator[TryCatchBlock]":
-        with self._content.withTryBlock() as b:
-            yield b
+    def withTryBlock(self) -> "ContextManager[TryCatchBlock]":
+        return self._content.withTryBlock()
 
-    @contextmanager
-    def withCond(self, expr: "PanExpr") -> "Iterator[ConditionalBlock]":
-        with self._content.withCond(expr) as cond:
-            yield cond
+    def withCond(self, expr: "PanExpr") -> "ContextManager[ConditionalBlock]":
+        return self._content.withCond(expr)
 
-    @contextmanager
     def withFor(
         self,
         assign: "PanVar",
         expr: "Pannable",
-    ) -> "Iterator[ForLoopBlock]":
-        with self._content.withFor(assign, expr) as loop:
-            yield loop
+    ) -> "ContextManager[ForLoopBlock]":
+        return self._content.withFor(assign, expr)
 
-    @contextmanager
     def withDictIter(
         self,
         v_dict: "PanExpr",
         v_val: "PanVar",
         v_key: "PanVar" = None,
-    ) -> "Iterator[DictLoopBlock]":
-        with self._content.withDictIter(v_dict, v_val, v_key) as loop:
-            yield loop
+    ) -> "ContextManager[DictLoopBlock]":
+        return self._content.withDictIter(v_dict, v_val, v_key)
 
     def write_to_path(
         self,
@@ -153,9 +210,21 @@ class Script(AcceptsStatements):
     ) -> None:
         # TODO: add a targetversion arg which can be used to do things like choose a target
         # language version (e.g. lang="php", targetversion="3.7")
+        if self.is_empty() and not pretty and not phpnamespace:
+            # nothing to render - skip the writer machinery and emit the bare preamble.
+            # (pretty/phpnamespace still take the full path so their handling stays in
+            # one place.)
+            assert lang in ("php", "python", "typescript")
+            target.write_text("<?php\n\n" if lang == "php" else "")
+            return
+
+        # render into an in-memory buffer first so the target file gets one big write()
+        # instead of one small write per line
+        buffer = io.StringIO()
+        writer = FileWriter(buffer, indentstr=indentstr)
+        self._write_to_writer(writer, lang=lang, pretty=pretty, phpnamespace=phpnamespace)
         with target.open("w") as f:
-            writer = FileWriter(f, indentstr=indentstr)
-            self._write_to_writer(writer, lang=lang, pretty=pretty, phpnamespace=phpnamespace)
+            f.write(buffer.getvalue())
 
     def write_to_handle(
         self,
@@ -168,10 +237,14 @@ class Script(AcceptsStatements):
     ) -> None:
         # TODO: add a targetversion arg which can be used to do things like choose a target
         # language version (e.g. lang="php", targetversion="3.7")
-        writer = FileWriter(handle, indentstr=indentstr)
+        # as per write_to_path(), buffer everything and hand it over in a single write()
+        buffer = io.StringIO()
+        writer = FileWriter(buffer, indentstr=indentstr)
 
         self._write_to_writer(writer, lang=lang, pretty=pretty, phpnamespace=phpnamespace)
 
+        handle.write(buffer.getvalue())
+
     def get_source_code(
         self,
         *,
@@ -190,8 +263,9 @@ class Script(AcceptsStatements):
 
         self._write_to_writer(writer, lang=lang, pretty=pretty, phpnamespace=phpnamespace)
 
-        handle.seek(0)
-        return handle.read()
+        # getvalue() hands back the buffer contents without the seek+read round trip
+        # (which built a second full copy of the source)
+        return handle.getvalue()
 
     def _write_to_writer(
         self,
@@ -204,41 +278,24 @@ class Script(AcceptsStatements):
         if pretty:
             raise NotImplementedError("Prettifying is not yet supported")
 
-        if lang == "php":
-            from paradox.output import php
-
-            write_file_comments = php.write_file_comments
-            write_top_imports = php.write_top_imports
-            write_custom_types = php.write_custom_types
+        outmod = _get_output_module(lang)
 
+        if lang == "php":
             writer.line0("<?php")
             writer.blank()
-        elif lang == "python":
-            from paradox.output import python
-
-            write_file_comments = python.write_file_comments
-            write_top_imports = python.write_top_imports
-            write_custom_types = python.write_custom_types
-        else:
-            assert lang == "typescript"
-            from paradox.output import typescript
-
-            write_file_comments = typescript.write_file_comments
-            write_top_imports = typescript.write_top_imports
-            write_custom_types = typescript.write_custom_types
 
         # first, write out any file header
         if self._file_comments:
-            write_file_comments(writer, self._file_comments)
+            outmod.write_file_comments(writer, self._file_comments)
 
         # if php, might need to write a PHP namespace
         if lang == "php" and phpnamespace:
             writer.line0(f"namespace {phpnamespace};")
             writer.blank()
 
-        write_top_imports(writer, top=self._content, script=self)
+        outmod.write_top_imports(writer, top=self._content, script=self)
 
-        write_custom_types(writer, script=self)
+        outmod.write_custom_types(writer, script=self)
 
         if lang == "php":
             self._content.writephp(writer)
@@ -251,6 +308,10 @@ class Script(AcceptsStatements):
 
 @dataclass
 class NewTypeDetails:
+    # no field defaults, so a manual __slots__ is safe here (and keeps us py3.8
+    # compatible where dataclass(slots=True) isn't available)
+    __slots__ = ("name", "base", "tsexport")
+
     name: str
     base: "CrossType"
     tsexport: bool
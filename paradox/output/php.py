@@ -3,35 +3,35 @@ from typing import Dict, List, Optional
 from paradox.interfaces import WantsImports
 from paradox.output import FileWriter, Script
 
+# sentinel for write_top_imports()'s duplicate detection
+_MISSING = object()
+
 
 def write_file_comments(writer: FileWriter, comments: List[str]) -> None:
-    for text in comments:
-        if len(text):
-            writer.line0(f"// {text}")
-        else:
-            writer.line0("//")
-    if len(comments):
-        writer.blank()
+    if not comments:
+        return
+
+    writer.lines0([f"// {text}" if text else "//" for text in comments])
+    writer.blank()
 
 
 def write_top_imports(writer: FileWriter, *, top: WantsImports, script: Script) -> None:
     # group imports by source module so that we can sort them
     imports: Dict[str, Optional[str]] = {}
     for original, alias in top.getImportsPHP():
-        try:
-            assert imports[original] == alias
-        except KeyError:
+        existing = imports.get(original, _MISSING)
+        if existing is _MISSING:
             imports[original] = alias
-
-    # next, write out imports
-    wroteimports = False
-    for original, alias in sorted(imports.items()):
-        if alias:
-            writer.line0(f"use {original} as {alias};")
         else:
-            writer.line0(f"use {original};")
-        wroteimports = True
-    if wroteimports:
+            assert existing == alias
+
+    # next, write out imports as a single batched block
+    import_lines = [
+        f"use {original} as {alias};" if alias else f"use {original};"
+        for original, alias in sorted(imports.items())
+    ]
+    if import_lines:
+        writer.lines0(import_lines)
         writer.blank()
 
 
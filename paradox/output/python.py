@@ -6,47 +6,51 @@ from paradox.output import FileWriter, Script
 
 
 def write_file_comments(writer: FileWriter, comments: List[str]) -> None:
-    writer.line0('"""')
-    for comment in comments:
-        writer.line0(comment)
-    writer.line0('"""')
+    if not comments:
+        return
+
+    writer.lines0(['"""', *comments, '"""'])
 
 
 def write_top_imports(writer: FileWriter, *, top: WantsImports, script: Script) -> None:
-    # group imports first
+    # group imports first. Names are collected with plain list appends (cheaper than
+    # per-item set inserts given how few duplicates survive the tree-level dedupe) and
+    # deduplicated once per module at emit time.
     direct_imports: Set[str] = set()
-    named_imports: Dict[str, Set[str]] = defaultdict(set)
+    named_imports: Dict[str, List[str]] = defaultdict(list)
     for module, name in top.getImportsPy():
         if name is None:
             direct_imports.add(module)
         else:
-            named_imports[module].add(name)
+            named_imports[module].append(name)
 
     for newtype in script._new_types.values():
-        named_imports["typing"].add("NewType")
-        for module, name in newtype.base.getPyImports():
+        named_imports["typing"].append("NewType")
+        for module, name in newtype.base.getPyImportsList():
             if name is None:
                 direct_imports.add(module)
             else:
-                named_imports[module].add(name)
+                named_imports[module].append(name)
 
-    for name in sorted(direct_imports):
-        writer.line0(f"import {name}")
     if direct_imports:
+        writer.lines0([f"import {name}" for name in sorted(direct_imports)])
         writer.blank()
 
-    for module, imported_names in sorted(named_imports.items(), key=lambda pair: pair[0]):
-        writer.line0(f"from {module} import {', '.join(sorted(imported_names))}")
     if named_imports:
+        writer.lines0(
+            [
+                f"from {module} import {', '.join(sorted(set(imported_names)))}"
+                for module, imported_names in sorted(named_imports.items())
+            ]
+        )
         writer.blank()
 
 
 def write_custom_types(writer: FileWriter, script: Script) -> None:
-    count = 0
-    for newtype in script._new_types.values():
-        pytype = newtype.base.getPyType()[0]
-        name = newtype.name
-        writer.line0(f"{name} = NewType({name!r}, {pytype})")
-        count += 1
-    if count:
+    lines = [
+        f"{newtype.name} = NewType({newtype.name!r}, {newtype.base.getPyType()[0]})"
+        for newtype in script._new_types.values()
+    ]
+    if lines:
+        writer.lines0(lines)
         writer.blank()
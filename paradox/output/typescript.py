@@ -1,51 +1,48 @@
 from collections import defaultdict
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional
 
 from paradox.interfaces import WantsImports
 from paradox.output import FileWriter, Script
 
 
 def write_file_comments(writer: FileWriter, comments: List[str]) -> None:
-    for comment in comments:
-        if len(comment):
-            writer.line0(f"// {comment}")
-        else:
-            writer.line0("//")
+    if not comments:
+        return
+
+    writer.lines0([f"// {comment}" if comment else "//" for comment in comments])
 
 
 def write_top_imports(writer: FileWriter, *, top: WantsImports, script: Script) -> None:
-    # group imports by source module so that we can remove duplicates
-    imports_by_module: Dict[str, Set[Optional[str]]] = defaultdict(set)
+    # group imports by source module; names are gathered with list appends and
+    # deduplicated per module at emit time
+    imports_by_module: Dict[str, List[Optional[str]]] = defaultdict(list)
     for module, names in top.getImportsTS():
         if names is None:
-            imports_by_module[module].add(None)
+            imports_by_module[module].append(None)
         else:
-            imports_by_module[module].update(names)
+            imports_by_module[module].extend(names)
 
-    # next, write out imports
+    # next, write out imports as a single batched block
+    import_lines: List[str] = []
     for module, names2 in imports_by_module.items():
-        strnames = set()
-        for name in names2:
-            if name is None:
-                writer.line0(f"import '{module}';")
-            else:
-                strnames.add(name)
-        for name in sorted(strnames):
-            writer.line0(f"import {{{name}}} from '{module}';")
-    if len(imports_by_module):
+        if None in names2:
+            import_lines.append(f"import '{module}';")
+        for name in sorted(set(name for name in names2 if name is not None)):
+            import_lines.append(f"import {{{name}}} from '{module}';")
+    writer.lines0(import_lines)
+    if imports_by_module:
         writer.blank()
 
 
+# shared suffix for branded types - built once instead of per newtype
+_BRAND_SUFFIX = " & {readonly brand: unique symbol};"
+
+
 def write_custom_types(writer: FileWriter, script: Script) -> None:
-    havenewtypes = False
+    lines = []
     for newtype in script._new_types.values():
-        havenewtypes = True
-        prefix = ""
-        if newtype.tsexport:
-            prefix = "export "
-        tstype = newtype.base.getTSType()[0]
-        writer.line0(
-            prefix + f"type {newtype.name} = {tstype} & {{readonly brand: unique symbol}};"
-        )
-    if havenewtypes:
+        prefix = "export " if newtype.tsexport else ""
+        lines.append(f"{prefix}type {newtype.name} = {newtype.base.getTSTypeStr()}{_BRAND_SUFFIX}")
+    if lines:
+        writer.lines0(lines)
         writer.blank()
@@ -10,13 +10,39 @@ from paradox.interfaces import (
     NotSupportedError,
 )
 
+# returned by the base getPyImports()/getImportsPHP(): primitive types like CrossStr
+# have no imports, and a shared empty tuple means import collection over them doesn't
+# allocate anything. (ImportSpecPy and ImportSpecPHP are the same (module, name) shape
+# so the one singleton serves both getters.)
+_EMPTY_IMPORTS: Tuple[ImportSpecPy, ...] = ()
+
 
 class CrossType(abc.ABC):
+    # lazily-populated cache for getQuotedPyType(). CrossType type strings are immutable
+    # once constructed, so FunctionSpec/ClassSpec writers that hit the same CrossType
+    # many times over shouldn't recompute them.
+    _quotedpy: Optional[str] = None
+    _tstypestr: Optional[str] = None
+    _pytype: "Optional[Tuple[str, bool]]" = None
+    _tstype: "Optional[Tuple[str, bool]]" = None
+    _phptypes: "Optional[Tuple[Optional[str], str, bool]]" = None
+    _pyimportlist: Optional[List[ImportSpecPy]] = None
+
     def getPyImports(self) -> Iterable[ImportSpecPy]:
-        return []
+        return _EMPTY_IMPORTS
+
+    def getPyImportsList(self) -> List[ImportSpecPy]:
+        """Flattened getPyImports(), cached on the instance.
+
+        The same CrossType instance typically appears in dozens of args/properties, and
+        the import derivation recurses through composite types; do it once."""
+        cached = self._pyimportlist
+        if cached is None:
+            self._pyimportlist = cached = list(self.getPyImports())
+        return cached
 
     def getImportsPHP(self) -> Iterable[ImportSpecPHP]:
-        return []
+        return _EMPTY_IMPORTS
 
     @abc.abstractmethod
     def getPyType(self) -> Tuple[str, bool]:
@@ -28,15 +54,41 @@ class CrossType(abc.ABC):
         quoted. Some magic types like builtins.ellipsis also only work in quotes.
         """
 
+    def getTSTypeStr(self) -> str:
+        """Like getTSType()[0], but the string is cached on the instance."""
+        cached = self._tstypestr
+        if cached is None:
+            self._tstypestr = cached = self.getTSType()[0]
+        return cached
+
+    def getPHPArgType(self) -> Optional[str]:
+        """The PHP in-language type - getPHPTypes()[0] - cached on the instance."""
+        cached = self._phptypes
+        if cached is None:
+            self._phptypes = cached = self.getPHPTypes()
+        return cached[0]
+
+    def getPHPDocType(self) -> str:
+        """The phpDocumentor type - getPHPTypes()[1] - cached on the instance."""
+        cached = self._phptypes
+        if cached is None:
+            self._phptypes = cached = self.getPHPTypes()
+        return cached[1]
+
     def getQuotedPyType(self) -> str:
         """Get the Python Type string for this CrossType, wrapped in quotes if needed."""
+        cached = self._quotedpy
+        if cached is not None:
+            return cached
+
         typeexpr, quote = self.getPyType()
         assert isinstance(typeexpr, str)
 
         if quote:
             # use repr() to wrap the whole thing in quotes
-            return repr(typeexpr)
+            typeexpr = repr(typeexpr)
 
+        self._quotedpy = typeexpr
         return typeexpr
 
     @abc.abstractmethod
@@ -162,6 +214,9 @@ class CrossLiteral(CrossType):
         yield "typing", "Literal"
 
     def getTSType(self) -> Tuple[str, bool]:
+        cached = self._tstype
+        if cached is not None:
+            return cached
         each = []
         for val in _sorted_literals(self._booleans, self._other):
             if isinstance(val, bool):
@@ -171,13 +226,20 @@ class CrossLiteral(CrossType):
             else:
                 assert isinstance(val, str)
                 each.append(repr(val))
-        return " | ".join(each), True
+        self._tstype = cached = (" | ".join(each), True)
+        return cached
 
     def getPyType(self) -> Tuple[str, bool]:
-        inner = map(repr, _sorted_literals(self._booleans, self._other))
-        return f"Literal[{', '.join(inner)}]", False
+        cached = self._pytype
+        if cached is None:
+            inner = map(repr, _sorted_literals(self._booleans, self._other))
+            self._pytype = cached = (f"Literal[{', '.join(inner)}]", False)
+        return cached
 
     def getPHPTypes(self) -> Tuple[Optional[str], str, bool]:
+        cached = self._phptypes
+        if cached is not None:
+            return cached
         # PHP doesn't have support for literals, so we just use vanilla types
         subtypes = set()
         if len(self._booleans):
@@ -191,9 +253,10 @@ class CrossLiteral(CrossType):
         subtypes2 = list(sorted(subtypes))
         assert len(subtypes2)
         if len(subtypes2) == 1:
-            return subtypes2[0], subtypes2[0], True
-
-        return "mixed", "|".join(subtypes2), False
+            self._phptypes = cached = (subtypes2[0], subtypes2[0], True)
+        else:
+            self._phptypes = cached = ("mixed", "|".join(subtypes2), False)
+        return cached
 
 
 class CrossOmit(CrossType):
@@ -221,7 +284,8 @@ class CrossOptional(CrossType):
 
     def getPyImports(self) -> Iterable[ImportSpecPy]:
         yield from super().getPyImports()
-        yield from self._inner.getPyImports()
+        # recurse via the cached lists so shared subtrees are only ever walked once
+        yield from self._inner.getPyImportsList()
         yield "typing", "Optional"
 
     def expandWith(self, *other: CrossType) -> "CrossUnion":
@@ -230,17 +294,27 @@ class CrossOptional(CrossType):
         return CrossUnion(items)
 
     def getTSType(self) -> Tuple[str, bool]:
-        return self._inner.getTSType()[0] + " | null", False
+        cached = self._tstype
+        if cached is None:
+            self._tstype = cached = (self._inner.getTSType()[0] + " | null", False)
+        return cached
 
     def getPyType(self) -> Tuple[str, bool]:
-        innertype, innerquote = self._inner.getPyType()
-        return f"Optional[{innertype}]", innerquote
+        cached = self._pytype
+        if cached is None:
+            innertype, innerquote = self._inner.getPyType()
+            self._pytype = cached = (f"Optional[{innertype}]", innerquote)
+        return cached
 
     def getPHPTypes(self) -> Tuple[Optional[str], str, bool]:
-        innertype = self._inner.getPHPTypes()[1]
+        cached = self._phptypes
+        if cached is None:
+            innertype = self._inner.getPHPTypes()[1]
 
-        # IIRC we have to put the null variant first to satisfy some php linters and/or formatters
-        return None, "null|" + innertype, False
+            # IIRC we have to put the null variant first to satisfy some php linters
+            # and/or formatters
+            self._phptypes = cached = (None, "null|" + innertype, False)
+        return cached
 
 
 class CrossList(CrossType):
@@ -251,27 +325,40 @@ class CrossList(CrossType):
 
     def getPyImports(self) -> Iterable[ImportSpecPy]:
         yield from super().getPyImports()
-        yield from self._wrapped.getPyImports()
+        yield from self._wrapped.getPyImportsList()
         yield "typing", "List"
 
     def getWrappedType(self) -> CrossType:
         return self._wrapped
 
     def getTSType(self) -> Tuple[str, bool]:
-        inner, listable = self._wrapped.getTSType()
-
-        if listable:
-            return inner + "[]", False
+        cached = self._tstype
+        if cached is None:
+            inner, listable = self._wrapped.getTSType()
 
-        return f"Array<{inner}>", False
+            if listable:
+                self._tstype = cached = (inner + "[]", False)
+            else:
+                self._tstype = cached = (f"Array<{inner}>", False)
+        return cached
 
     def getPyType(self) -> Tuple[str, bool]:
-        innertype, innerquote = self._wrapped.getPyType()
-        return f"List[{innertype}]", innerquote
+        cached = self._pytype
+        if cached is None:
+            innertype, innerquote = self._wrapped.getPyType()
+            self._pytype = cached = (f"List[{innertype}]", innerquote)
+        return cached
 
     def getPHPTypes(self) -> Tuple[Optional[str], str, bool]:
-        _, innertype, canbearray = self._wrapped.getPHPTypes()
-        return "array", innertype + "[]" if canbearray else "mixed", False
+        cached = self._phptypes
+        if cached is None:
+            _, innertype, canbearray = self._wrapped.getPHPTypes()
+            self._phptypes = cached = (
+                "array",
+                innertype + "[]" if canbearray else "mixed",
+                False,
+            )
+        return cached
 
 
 class CrossSet(CrossType):
@@ -282,18 +369,24 @@ class CrossSet(CrossType):
 
     def getPyImports(self) -> Iterable[ImportSpecPy]:
         yield from super().getPyImports()
-        yield from self._wrapped.getPyImports()
+        yield from self._wrapped.getPyImportsList()
         yield "typing", "Set"
 
     def getWrappedType(self) -> CrossType:
         return self._wrapped
 
     def getTSType(self) -> Tuple[str, bool]:
-        return f"Set<{self._wrapped.getTSType()[0]}>", False
+        cached = self._tstype
+        if cached is None:
+            self._tstype = cached = (f"Set<{self._wrapped.getTSType()[0]}>", False)
+        return cached
 
     def getPyType(self) -> Tuple[str, bool]:
-        innertype, innerquote = self._wrapped.getPyType()
-        return f"Set[{innertype}]", innerquote
+        cached = self._pytype
+        if cached is None:
+            innertype, innerquote = self._wrapped.getPyType()
+            self._pytype = cached = (f"Set[{innertype}]", innerquote)
+        return cached
 
     def getPHPTypes(self) -> Tuple[Optional[str], str, bool]:
         raise NotSupportedError("PHP has no Set type")
@@ -310,8 +403,8 @@ class CrossDict(CrossType):
 
     def getPyImports(self) -> Iterable[ImportSpecPy]:
         yield from super().getPyImports()
-        yield from self._key.getPyImports()
-        yield from self._val.getPyImports()
+        yield from self._key.getPyImportsList()
+        yield from self._val.getPyImportsList()
         yield "typing", self._pythondicttype
 
     def getKeyType(self) -> CrossType:
@@ -321,26 +414,48 @@ class CrossDict(CrossType):
         return self._val
 
     def getTSType(self) -> Tuple[str, bool]:
-        return f"{{[k: {self._key.getTSType()[0]}]: {self._val.getTSType()[0]}}}", False
+        cached = self._tstype
+        if cached is None:
+            self._tstype = cached = (
+                f"{{[k: {self._key.getTSType()[0]}]: {self._val.getTSType()[0]}}}",
+                False,
+            )
+        return cached
 
     def getPyType(self) -> Tuple[str, bool]:
-        keytype, keyquote = self._key.getPyType()
-        valtype, valquote = self._val.getPyType()
-        return (
-            f"{self._pythondicttype}[{keytype}, {valtype}]",
-            keyquote or valquote,
-        )
+        cached = self._pytype
+        if cached is None:
+            keytype, keyquote = self._key.getPyType()
+            valtype, valquote = self._val.getPyType()
+            self._pytype = cached = (
+                f"{self._pythondicttype}[{keytype}, {valtype}]",
+                keyquote or valquote,
+            )
+        return cached
 
     def getPHPTypes(self) -> Tuple[Optional[str], str, bool]:
-        _, innertype, canbearray = self._val.getPHPTypes()
-        return "array", innertype + "[]" if canbearray else "mixed", False
+        cached = self._phptypes
+        if cached is None:
+            _, innertype, canbearray = self._val.getPHPTypes()
+            self._phptypes = cached = (
+                "array",
+                innertype + "[]" if canbearray else "mixed",
+                False,
+            )
+        return cached
 
 
 class CrossMap(CrossDict):
     _pythondicttype = "Mapping"
 
     def getTSType(self) -> Tuple[str, bool]:
-        return f"Map<{self._key.getTSType()[0]}, {self._val.getTSType()[0]}>", False
+        cached = self._tstype
+        if cached is None:
+            self._tstype = cached = (
+                f"Map<{self._key.getTSType()[0]}, {self._val.getTSType()[0]}>",
+                False,
+            )
+        return cached
 
     def getPHPTypes(self) -> Tuple[Optional[str], str, bool]:
         return "Ds\\Map", "Ds\\Map", True
@@ -355,7 +470,7 @@ class CrossUnion(CrossType):
     def getPyImports(self) -> Iterable[ImportSpecPy]:
         yield from super().getPyImports()
         for inner in self._inner:
-            yield from inner.getPyImports()
+            yield from inner.getPyImportsList()
         yield "typing", "Union"
 
     def alsoWith(self, *other: CrossType) -> "CrossUnion":
@@ -366,21 +481,33 @@ class CrossUnion(CrossType):
         return any(isinstance(t, CrossOmit) for t in self._inner)
 
     def getTSType(self) -> Tuple[str, bool]:
-        return " | ".join([t.getTSType()[0] for t in self._inner]), False
+        cached = self._tstype
+        if cached is None:
+            self._tstype = cached = (
+                " | ".join([t.getTSType()[0] for t in self._inner]),
+                False,
+            )
+        return cached
 
     def getPyType(self) -> Tuple[str, bool]:
-        inner = []
-        quote = False
-        for t in self._inner:
-            innertype, innerquote = t.getPyType()
-            inner.append(innertype)
-            if innerquote:
-                quote = True
-        return f"Union[{', '.join(inner)}]", quote
+        cached = self._pytype
+        if cached is None:
+            inner = []
+            quote = False
+            for t in self._inner:
+                innertype, innerquote = t.getPyType()
+                inner.append(innertype)
+                if innerquote:
+                    quote = True
+            self._pytype = cached = (f"Union[{', '.join(inner)}]", quote)
+        return cached
 
     def getPHPTypes(self) -> Tuple[Optional[str], str, bool]:
-        inner = [t.getPHPTypes()[1] for t in self._inner]
-        return None, "|".join(inner), False
+        cached = self._phptypes
+        if cached is None:
+            inner = [t.getPHPTypes()[1] for t in self._inner]
+            self._phptypes = cached = (None, "|".join(inner), False)
+        return cached
 
 
 class CrossCallable(CrossType):
@@ -392,12 +519,15 @@ class CrossCallable(CrossType):
 
     def getPyImports(self) -> Iterable[ImportSpecPy]:
         yield from super().getPyImports()
-        yield from self._ret.getPyImports()
+        yield from self._ret.getPyImportsList()
         for arg in self._args:
-            yield from arg.getPyImports()
+            yield from arg.getPyImportsList()
         yield "typing", "Callable"
 
     def getTSType(self) -> Tuple[str, bool]:
+        cached = self._tstype
+        if cached is not None:
+            return cached
         # obviously we only support up to 52 arguments
         chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
         if len(self._args) > len(chars):
@@ -405,9 +535,13 @@ class CrossCallable(CrossType):
                 f"CrossCallable() implementation does not support more than {len(chars)} arguments"
             )
         argtypes = [f"{chars[i]}: {t.getTSType()[0]}" for i, t in enumerate(self._args)]
-        return f"({', '.join(argtypes)}) => {self._ret.getTSType()[0]}", False
+        self._tstype = cached = (f"({', '.join(argtypes)}) => {self._ret.getTSType()[0]}", False)
+        return cached
 
     def getPyType(self) -> Tuple[str, bool]:
+        cached = self._pytype
+        if cached is not None:
+            return cached
         argtypes = []
         quote = False
         for t in self._args:
@@ -416,7 +550,11 @@ class CrossCallable(CrossType):
             if argquote:
                 quote = True
         rettype, retquote = self._ret.getPyType()
-        return f"Callable[[{', '.join(argtypes)}], {rettype}]", quote or retquote
+        self._pytype = cached = (
+            f"Callable[[{', '.join(argtypes)}], {rettype}]",
+            quote or retquote,
+        )
+        return cached
 
     def getPHPTypes(self) -> Tuple[Optional[str], str, bool]:
         return None, "callable", True
@@ -448,6 +586,7 @@ class CrossCustomType(CrossType):
         self._pythonimports: List[ImportSpecPy] = []
 
     def alsoImportPy(self, module: str, names: List[str] = None) -> None:
+        self._pyimportlist = None
         if names is None:
             self._pythonimports.append((module, None))
         else:
@@ -486,17 +625,28 @@ class CrossCustomType(CrossType):
 FlexiType = Union[CrossType, Type[str], Type[int], Type[bool]]
 
 
+# shared instances returned by unflex(). These simple types carry no state of their
+# own, so every unflex(str) etc can hand back the same object instead of building a
+# fresh one per argument/property declared.
+_CROSS_NULL = CrossNull()
+_CROSS_STR = CrossStr()
+_CROSS_NUM = CrossNum()
+_CROSS_BOOL = CrossBool()
+
+
 def unflex(t: Union[FlexiType, None], *, allownewtypes: bool = False) -> CrossType:
+    # test for CrossType first - it's the common case at hot call sites like
+    # FunctionSpec.addPositionalArg()
+    if isinstance(t, CrossType):
+        return t
     if t is None:
-        return CrossNull()
+        return _CROSS_NULL
     if t is str:
-        return CrossStr()
+        return _CROSS_STR
     if t is int:
-        return CrossNum()
+        return _CROSS_NUM
     if t is bool:
-        return CrossBool()
-    if isinstance(t, CrossType):
-        return t
+        return _CROSS_BOOL
 
     # TODO: unit test this
     raise TypeError(f"Cannot unflex {t.__name__}")
@@ -0,0 +1,51 @@
+import io
+
+from paradox.expressions import PanCall, pan
+from paradox.generate.statements import Statements
+from paradox.output import FileWriter
+
+
+def _build() -> Statements:
+    stmts = Statements()
+    with stmts.withCond(pan(True)) as cond:
+        cond.also(PanCall("some_fn", pan(5)))
+        cond.alsoReturn(pan("done"))
+    return stmts
+
+
+def test_write_all_matches_sequential_output() -> None:
+    stmts = _build()
+
+    # render each language directly ...
+    want_py = io.StringIO()
+    want_ts = io.StringIO()
+    want_php = io.StringIO()
+    stmts.writepy(FileWriter(want_py, "    "))
+    stmts.writets(FileWriter(want_ts, "    "))
+    stmts.writephp(FileWriter(want_php, "    "))
+
+    # ... then all at once via write_all()
+    got_py = io.StringIO()
+    got_ts = io.StringIO()
+    got_php = io.StringIO()
+    stmts.write_all(
+        FileWriter(got_py, "    "),
+        FileWriter(got_ts, "    "),
+        FileWriter(got_php, "    "),
+    )
+
+    assert got_py.getvalue() == want_py.getvalue()
+    assert got_ts.getvalue() == want_ts.getvalue()
+    assert got_php.getvalue() == want_php.getvalue()
+
+
+def test_write_all_skips_None_writers() -> None:
+    stmts = _build()
+
+    got_py = io.StringIO()
+    stmts.write_all(FileWriter(got_py, "    "), None, None)
+
+    want_py = io.StringIO()
+    stmts.writepy(FileWriter(want_py, "    "))
+
+    assert got_py.getvalue() == want_py.getvalue()
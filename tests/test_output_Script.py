@@ -103,3 +103,23 @@ def test_cannot_add_same_new_type_twice() -> None:
     s.add_new_type("some_type", unflex(str))
     with pytest.raises(InvalidLogic):
         s.add_new_type("some_type", unflex(str))
+
+
+def test_empty_Script_write_to_path(LANG: SupportedLang) -> None:
+    s = Script()
+    assert s.is_empty()
+
+    with TemporaryDirectory() as tmp:
+        target = Path(tmp) / "generated"
+        s.write_to_path(target, lang=LANG)
+        expected = "<?php\n\n" if LANG == "php" else ""
+        assert target.read_text() == expected
+
+        if LANG == "php":
+            # a namespace must still be written out even when there is no content
+            s.write_to_path(target, lang=LANG, phpnamespace="Some\\Space")
+            assert "namespace Some\\Space;" in target.read_text()
+
+    # adding anything makes the script non-empty
+    s.remark("no longer empty")
+    assert not s.is_empty()